@@ -0,0 +1,68 @@
+"""Maya callbacks used to invalidate the various caches of omwrapper"""
+from typing import List
+
+from maya.api import OpenMaya as om
+
+from omwrapper.pytools import Signal
+
+# Emitted when a new scene is created or opened. Caches that only depend on the content of the scene connect to it.
+scene_changed = Signal()
+# Emitted whenever a node is added, removed, renamed or reparented, or when the scene changes. Caches keyed by name
+# connect to it, as any of these events may change what a given name points to.
+dg_changed = Signal()
+# Emitted when the UI time unit changes, or when the scene changes as the new scene may use another unit
+time_unit_changed = Signal()
+
+# Kept across reloads of this module, so that install can remove the callbacks registered by the previous version
+_callback_ids: List[int] = globals().get('_callback_ids', [])
+
+
+def _on_scene_changed(*args):
+    scene_changed.emit()
+    dg_changed.emit()
+    time_unit_changed.emit()
+
+
+def _on_dg_changed(*args):
+    dg_changed.emit()
+
+
+def _on_time_unit_changed(*args):
+    time_unit_changed.emit()
+
+
+def install():
+    """
+    Registers the Maya callbacks that emit the scene_changed, dg_changed and time_unit_changed signals. Any previously
+    installed callbacks are removed first
+
+    Returns:
+        None
+
+    """
+    uninstall()
+    _callback_ids.extend((
+        om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew, _on_scene_changed),
+        om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, _on_scene_changed),
+        om.MDGMessage.addNodeAddedCallback(_on_dg_changed, 'dependNode'),
+        om.MDGMessage.addNodeRemovedCallback(_on_dg_changed, 'dependNode'),
+        om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, _on_dg_changed),
+        om.MDagMessage.addAllDagChangesCallback(_on_dg_changed),
+        om.MEventMessage.addEventCallback('timeUnitChanged', _on_time_unit_changed),
+    ))
+
+
+def uninstall():
+    """
+    Removes the Maya callbacks registered by install
+
+    Returns:
+        None
+
+    """
+    if _callback_ids:
+        om.MMessage.removeCallbacks(_callback_ids)
+        del _callback_ids[:]
+
+
+install()
@@ -1,36 +1,42 @@
-from abc import ABC, abstractmethod
 from functools import wraps
 from typing import Union, Callable, Any, Type
 
 from maya.api import OpenMaya as om
 
-from omwrapper.api import apiundo
+from omwrapper.api import undoqueue
 
 
-class AbstractModifier(ABC):
+class AbstractModifier:
+    """
+    Base class of the custom modifiers. Subclasses must implement doIt and undoIt.
+    This is a plain class rather than an ABC to keep the instantiation of modifiers cheap, as they can be created by
+    the thousands when recording undo.
+    """
+    __slots__ = ()
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.doIt()
 
-    @abstractmethod
     def doIt(self) -> None:
-        ...
+        raise NotImplementedError(f'{self.__class__.__name__} must implement doIt')
 
-    @abstractmethod
     def undoIt(self) -> None:
-        ...
+        raise NotImplementedError(f'{self.__class__.__name__} must implement undoIt')
 
 
 TModifier = Union[om.MDGModifier, om.MDagModifier, AbstractModifier]
 
-def add_modifier(_modifier:Type[TModifier], undo:bool=True, post_call:Callable=None) -> Callable:
+def add_modifier(_modifier:Type[TModifier], undo:bool=True, post_call:Union[Callable, str]=None) -> Callable:
     """
     A decorator to apply a specific type of modifier to compatible functions
     Args:
         _modifier (AbstractModifier, MDGModifier, MDagModifier): the class of modifier to instantiate
         undo (bool): whether to manage the undo or not
+        post_call (Callable, str, optional): called without arguments after the modifier has been executed. A string is
+            the name of a method of the instance (the first argument), which allows decorating methods in a class body
 
     Returns:
         Callable : the wrapped function
@@ -39,21 +45,25 @@ def add_modifier(_modifier:Type[TModifier], undo:bool=True, post_call:Callable=N
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args:Any, **kwargs:Any) -> Any:
-            # If no modifier was provided, create one.
-            if kwargs.get('_modifier', None) is None:
-                modifier = _modifier()
-                kwargs['_modifier'] = modifier
-                result = func(*args, **kwargs)
-                modifier.doIt()
-
-                # If undo is True, then pass the newly created modifier into the apiundo.commit function
-                if undo:
-                    apiundo.commit(modifier.undoIt, modifier.doIt)
-                if post_call:
-                    post_call()
-                return result
-            # Else, just execute the function
-            else:
+            # If a modifier was provided, just execute the function. This is checked first as it is the hot path,
+            #  e.g. when filling a modifier in a loop or recursing through compound plugs
+            if kwargs.get('_modifier') is not None:
                 return func(*args, **kwargs)
+
+            # Else, create one
+            modifier = _modifier()
+            kwargs['_modifier'] = modifier
+            result = func(*args, **kwargs)
+            modifier.doIt()
+
+            # If undo is True, then pass the newly created modifier into the undoqueue.commit function
+            if undo:
+                undoqueue.commit(modifier.undoIt, modifier.doIt)
+            if post_call:
+                if isinstance(post_call, str):
+                    getattr(args[0], post_call)()
+                else:
+                    post_call()
+            return result
         return wrapper
     return decorator
\ No newline at end of file
@@ -1,20 +1,28 @@
-from typing import Union, Callable, List
+from functools import partial
+from typing import Union, Callable, List, Iterator
 
 from omwrapper.api.modifiers.base import AbstractModifier, TModifier
-from omwrapper.pytools import Iterator
 
 
 class CompoundModifier(AbstractModifier):
+    __slots__ = ('modifiers', '_reversed', '_reversed_dirty')
+
     def __init__(self, *args: TModifier):
         """
         Not an actual modifier but a compound of modifiers. The doIt and undoIt methods will iterate through all the
-        modifiers in the compound and execute the corresponding methods
+        modifiers in the compound and execute the corresponding methods.
+        Nested CompoundModifiers are flattened when they are added: their modifiers are spliced into this compound, so
+        the nested grouping is lost and later changes to the nested compound are not reflected here.
 
         Args:
             *args (MDGModifier, MDagModifier, AbstractModifier): basically any modifier-like object that has the two
             required methods doIt and undoIt
         """
-        self.modifiers = list(args)
+        self.modifiers = []
+        self.extend(args)
+        # Reversed copy of the modifiers used by undoIt, rebuilt lazily whenever the modifiers list changes
+        self._reversed = []
+        self._reversed_dirty = True
 
     def append(self, modifier: TModifier):
         """
@@ -27,7 +35,11 @@ class CompoundModifier(AbstractModifier):
             None
 
         """
-        self.modifiers.append(modifier)
+        if isinstance(modifier, CompoundModifier):
+            self.modifiers.extend(modifier.modifiers)
+        else:
+            self.modifiers.append(modifier)
+        self._reversed_dirty = True
 
     def extend(self, iterable:List[TModifier]):
         """
@@ -40,17 +52,25 @@ class CompoundModifier(AbstractModifier):
             None
 
         """
-        self.modifiers.extend(iterable)
+        for modifier in iterable:
+            if isinstance(modifier, CompoundModifier):
+                self.modifiers.extend(modifier.modifiers)
+            else:
+                self.modifiers.append(modifier)
+        self._reversed_dirty = True
 
-    def get_iterator(self) -> Iterator:
+    def __iter__(self) -> Iterator[TModifier]:
+        return iter(self.modifiers)
+
+    def get_iterator(self) -> Iterator[TModifier]:
         """
-        Get an Iterator object with the list of modifiers in this compound
+        Get an iterator over the list of modifiers in this compound
 
         Returns:
             Iterator
 
         """
-        return Iterator(self.modifiers)
+        return iter(self.modifiers)
 
     def doIt(self):
         """
@@ -59,30 +79,32 @@ class CompoundModifier(AbstractModifier):
         Returns:
             None
         """
-        it = self.get_iterator()
-        while not it.is_done():
-            it.current_item().doIt()
-            it.next()
+        for modifier in self.modifiers:
+            modifier.doIt()
 
     def undoIt(self):
         """
-        Iterate through all the modifiers and execute the undoIt function
+        Iterate through all the modifiers in reverse order and execute the undoIt function
 
         Returns:
             None
         """
-        # ToDo: should we reverse the list of modifiers for this ?
-        it = self.get_iterator()
-        while not it.is_done():
-            it.current_item().undoIt()
-            it.next()
+        if self._reversed_dirty:
+            self._reversed = self.modifiers[::-1]
+            self._reversed_dirty = False
+        for modifier in self._reversed:
+            modifier.undoIt()
 
 
 class ProxyModifier(AbstractModifier):
+    __slots__ = ('_do', '_undo')
+
     def __init__(self, do_func:Callable, do_args:Union[list, tuple]=None, do_kwargs:dict=None,
                  undo_func:Callable=None, undo_args:Union[list, tuple]=None, undo_kwargs:dict=None):
         """
-        A Proxy of a modifier to allow user to pass their own undo and redo functions
+        A Proxy of a modifier to allow user to pass their own undo and redo functions.
+        The args and kwargs are bound to their function upon construction, so changing them afterward has no effect.
+
         Args:
             do_func (Callable): the function executed in doIt
             do_args (List, Tuple, optional): the args for the doIt function
@@ -91,34 +113,29 @@ class ProxyModifier(AbstractModifier):
             undo_args (List, Tuple, optional): the args for the undoIt function
             undo_kwargs (Dict, optional): the keyword args for the undoIt function
         """
-        self._do_it = do_func
-        if undo_func is None:
-            self._undo_it = self._do_it
-        else:
-            self._undo_it = undo_func
-
-        if do_args is None:
-            self._do_args = ()
-        else:
-            self._do_args = do_args
+        self._do = self._bind(do_func, do_args, do_kwargs)
+        self._undo = self._bind(undo_func or do_func, undo_args, undo_kwargs)
 
-        if undo_args is None:
-            self._undo_args = ()
-        else:
-            self._undo_args = undo_args
+    @staticmethod
+    def _bind(func:Callable, args:Union[list, tuple, None], kwargs:Union[dict, None]) -> Callable:
+        """
+        Binds the given args and kwargs to the function, so that doIt and undoIt only have to make a call without
+        unpacking anything. Without args nor kwargs, the function is returned as is.
 
-        if do_kwargs is None:
-            self._do_kwargs = {}
-        else:
-            self._do_kwargs = do_kwargs
+        Args:
+            func (Callable): the function to bind
+            args (List, Tuple, None): the args for the function
+            kwargs (Dict, None): the keyword args for the function
 
-        if undo_kwargs is None:
-            self._undo_kwargs = {}
-        else:
-            self._undo_kwargs = undo_kwargs
+        Returns:
+            Callable: a callable that doesn't take any argument
+        """
+        if args or kwargs:
+            return partial(func, *(args or ()), **(kwargs or {}))
+        return func
 
     def doIt(self):
-        return self._do_it(*self._do_args, **self._do_kwargs)
+        return self._do()
 
     def undoIt(self):
-        return self._undo_it(*self._undo_args, **self._undo_kwargs)
\ No newline at end of file
+        return self._undo()
@@ -7,11 +7,10 @@ from omwrapper.constants import DataType
 
 # FixMe: there's something wrong with the inheritance here
 class DGModifier(AbstractModifier, om.MDGModifier):
-    def doIt(self) -> None:
-        om.MDGModifier.doIt(self)
-
-    def undoIt(self) -> None:
-        om.MDGModifier.undoIt(self)
+    # Aliased rather than wrapped to avoid an extra frame. They still override the abstract methods of
+    #  AbstractModifier, which comes first in the MRO
+    doIt = om.MDGModifier.doIt
+    undoIt = om.MDGModifier.undoIt
 
     def create_node(self, node_type:str, name:str=None) -> om.MObject:
         """
@@ -64,51 +63,32 @@ class DGModifier(AbstractModifier, om.MDGModifier):
         if data_type is None:
             data_type = DataType.from_mobject(plug.attribute())
 
+        # Use the proper newPlugValueXXX method depending on the data type.
+        # Simple plugs are the most common case, so they are dispatched before querying the plug for compounds
+        setter = _plug_setters.get(data_type)
+        if setter is not None:
+            setter(self, plug, value)
+            return
+
         # Handle the compound case
         if plug.isCompound:
             num_children = plug.numChildren()
-            if len(value) >= num_children:
-                for x in range(num_children):
-                    self.set_plug_value(plug.child(x), value[x])
-                return
-            else:
+            get_child = plug.child
+            if len(value) < num_children:
                 raise ValueError('Compound Attribute : value length does not match the amount of children')
 
-        # Use the proper newPlugValueXXX method depending on the data type.
-
-        if data_type == DataType.FLOAT:
-            self.newPlugValueFloat(plug, value)
-        elif data_type == DataType.INT:
-            self.newPlugValueInt(plug, value)
-        elif data_type == DataType.ENUM:
-            if isinstance(value, str):
-                mfn = om.MFnEnumAttribute(plug.attribute())
-                value = mfn.fieldValue(value)
-            self.newPlugValueInt(plug, value)
-        elif data_type == DataType.BOOL:
-            self.newPlugValueBool(plug, value)
-        elif data_type == DataType.ANGLE:
-            if not isinstance(value, om.MAngle):
-                value = DataType.to_angle(value)
-            self.newPlugValueMAngle(plug, value)
-        elif data_type == DataType.DISTANCE:
-            if not isinstance(value, om.MDistance):
-                value = DataType.to_distance(value)
-            self.newPlugValueMDistance(plug, value)
-        elif data_type == DataType.STRING:
-            if not isinstance(value, str):
-                value = DataType.to_string(value)
-            self.newPlugValueString(plug, value)
-        elif data_type == DataType.MATRIX:
-            if not isinstance(value, (om.MMatrix, om.MTransformationMatrix)):
-                value = DataType.to_matrix(value)
-            data = om.MFnMatrixData()
-            mobj = data.create(value)
-            self.set_plug_value(plug, mobj, DataType.MATRIX)
-        elif data_type == DataType.TIME:
-            if not isinstance(value, om.MTime):
-                value = DataType.to_time(value)
-            self.newPlugValueMTime(value)
+            if data_type in _numeric_compound_types:
+                # The children of numeric compounds are simple plugs, so we can dispatch them right away instead of
+                #  going through set_plug_value again for each of them
+                for x in range(num_children):
+                    child = get_child(x)
+                    setter = _plug_setters.get(DataType.from_mobject(child.attribute()))
+                    if setter is not None:
+                        setter(self, child, value[x])
+            else:
+                for x in range(num_children):
+                    self.set_plug_value(get_child(x), value[x])
+            return
 
     def connect_(self, s_plug:om.MPlug, d_plug:om.MPlug, force:bool=False, next_available:bool=True):
         # Check if both plugs are already connected
@@ -136,18 +116,20 @@ class DGModifier(AbstractModifier, om.MDGModifier):
         if len(args) == 1:
             d_plug = args[0]
             s_plug = d_plug.source()
+            # if nothing is connected, simply return
+            if s_plug.isNull:
+                return
+            self.disconnect(s_plug, d_plug)
         elif len(args) > 1:
-            d_plug = args[1]
+            # the first arg is the source, every other arg is a destination to disconnect from it
             s_plug = args[0]
+            if s_plug.isNull:
+                return
+            for d_plug in args[1:]:
+                self.disconnect(s_plug, d_plug)
         else:
             raise ValueError('disconnect_ needs at least the destination plug')
 
-        # if nothing is connected, simply return
-        if s_plug.isNull:
-            return
-
-        self.disconnect(s_plug, d_plug)
-
 
 class DagModifier(om.MDagModifier, DGModifier):
     def create_node(self, node_type:str, name:str=None, parent:om.MObject=om.MObject.kNullObj) -> om.MObject:
@@ -166,4 +148,63 @@ class DagModifier(om.MDagModifier, DGModifier):
         mobj = self.createNode(node_type, parent=parent)
         if name is not None:
             self.renameNode(mobj, name)
-        return mobj
\ No newline at end of file
+        return mobj
+
+
+# newPlugValueXXX dispatch used by DGModifier.set_plug_value. Each setter takes the modifier, the plug and the value,
+#  and converts the value to the type expected by the API if needed.
+# The MDGModifier methods are resolved once here, so that setting a plug doesn't walk the MRO of the modifier
+_new_plug_value = om.MDGModifier.newPlugValue
+_new_plug_value_float = om.MDGModifier.newPlugValueFloat
+_new_plug_value_int = om.MDGModifier.newPlugValueInt
+_new_plug_value_bool = om.MDGModifier.newPlugValueBool
+_new_plug_value_angle = om.MDGModifier.newPlugValueMAngle
+_new_plug_value_distance = om.MDGModifier.newPlugValueMDistance
+_new_plug_value_string = om.MDGModifier.newPlugValueString
+_new_plug_value_time = om.MDGModifier.newPlugValueMTime
+
+def _set_enum(mod:DGModifier, plug:om.MPlug, value:Any):
+    if isinstance(value, str):
+        mfn = om.MFnEnumAttribute(plug.attribute())
+        value = mfn.fieldValue(value)
+    _new_plug_value_int(mod, plug, value)
+
+def _set_angle(mod:DGModifier, plug:om.MPlug, value:Any):
+    if not isinstance(value, om.MAngle):
+        value = DataType.to_angle(value)
+    _new_plug_value_angle(mod, plug, value)
+
+def _set_distance(mod:DGModifier, plug:om.MPlug, value:Any):
+    if not isinstance(value, om.MDistance):
+        value = DataType.to_distance(value)
+    _new_plug_value_distance(mod, plug, value)
+
+def _set_string(mod:DGModifier, plug:om.MPlug, value:Any):
+    if not isinstance(value, str):
+        value = DataType.to_string(value)
+    _new_plug_value_string(mod, plug, value)
+
+def _set_matrix(mod:DGModifier, plug:om.MPlug, value:Any):
+    if not isinstance(value, (om.MMatrix, om.MTransformationMatrix)):
+        value = DataType.to_matrix(value)
+    data = om.MFnMatrixData()
+    _new_plug_value(mod, plug, data.create(value))
+
+def _set_time(mod:DGModifier, plug:om.MPlug, value:Any):
+    if not isinstance(value, om.MTime):
+        value = DataType.to_time(value)
+    _new_plug_value_time(mod, plug, value)
+
+_plug_setters = {DataType.FLOAT: _new_plug_value_float,
+                 DataType.INT: _new_plug_value_int,
+                 DataType.BOOL: _new_plug_value_bool,
+                 DataType.ENUM: _set_enum,
+                 DataType.ANGLE: _set_angle,
+                 DataType.DISTANCE: _set_distance,
+                 DataType.STRING: _set_string,
+                 DataType.MATRIX: _set_matrix,
+                 DataType.TIME: _set_time}
+
+# Compound data types whose children are all simple plugs
+_numeric_compound_types = frozenset((DataType.FLOAT2, DataType.FLOAT3, DataType.FLOAT4, DataType.INT2, DataType.INT3,
+                                     DataType.COLOR))
@@ -0,0 +1,67 @@
+"""Entry point to Maya's undo queue used by omwrapper, with support for grouping several commits into a single one"""
+from contextlib import contextmanager
+from typing import Callable, List, Optional, Tuple
+
+from omwrapper.api import apiundo
+
+# The (undo, redo) pairs recorded by the active batch, None when no batch is active
+_batch: Optional[List[Tuple[Callable, Callable]]] = None
+
+
+def _noop():
+    pass
+
+
+def commit(undo:Callable, redo:Callable=_noop):
+    """
+    Registers the undo and redo functions of an operation in Maya's undo queue. Inside a batch, they are recorded and
+    registered along with the rest of the batch when it ends
+
+    Args:
+        undo (Callable): the function called when undoing
+        redo (Callable, optional): the function called when redoing
+
+    Returns:
+        None
+
+    """
+    if _batch is None:
+        apiundo.commit(undo=undo, redo=redo)
+    else:
+        _batch.append((undo, redo))
+
+
+@contextmanager
+def batch():
+    """
+    Groups all the commits made in this context into a single entry of Maya's undo queue, undone in reverse order
+    and redone in order. Nested batches are merged into the outermost one.
+    Operations that were executed before an exception was raised are still registered, so they can be undone
+
+    Examples:
+        with batch():
+            for attr in attributes:
+                attr.set_keyable(False)
+                attr.set_locked(True)
+
+    """
+    global _batch
+    if _batch is not None:
+        yield
+        return
+
+    records = _batch = []
+    try:
+        yield
+    finally:
+        _batch = None
+        if records:
+            def undo():
+                for undo_func, _ in reversed(records):
+                    undo_func()
+
+            def redo():
+                for _, redo_func in records:
+                    redo_func()
+
+            apiundo.commit(undo=undo, redo=redo)
@@ -1,13 +1,59 @@
-from functools import wraps
+from functools import wraps, lru_cache
 from typing import Union, Tuple, Any, List
 
 from maya.api import OpenMaya as om
 from maya import OpenMaya as om1
 
-from omwrapper.api import apiundo
+from omwrapper.api import undoqueue, callbacks
 from omwrapper.api.modifiers.base import TModifier
 from omwrapper.constants import DataType
 
+def _build_selection(name:str) -> om.MSelectionList:
+    """
+    Builds an MSelectionList holding the object with the given name
+
+    Args:
+        name (str): the name of any maya object
+
+    Returns:
+        MSelectionList: a selection list with the object as its first item
+
+    Raises:
+        NameError: the object does not exist or is not unique
+
+    """
+    sel = om.MSelectionList()
+    try:
+        sel.add(name)
+    except RuntimeError:
+        raise NameError('{} does not exist or is not unique'.format(name))
+    return sel
+
+# Node names are cached until a node is added, removed, renamed or reparented, since any of those can change what the
+#  name points to. The getters of MSelectionList return new API objects on each call, so sharing a cached list is safe
+_get_node_selection = lru_cache(maxsize=4096)(_build_selection)
+callbacks.dg_changed.connect(_get_node_selection.cache_clear)
+
+def _get_selection(name:str) -> om.MSelectionList:
+    """
+    Gets an MSelectionList holding the object with the given name. Only node names are cached: attributes and
+    components can be added, removed or changed without any of the callbacks firing, so their names are always
+    resolved again
+
+    Args:
+        name (str): the name of any maya object
+
+    Returns:
+        MSelectionList: a selection list with the object as its first item
+
+    Raises:
+        NameError: the object does not exist or is not unique
+
+    """
+    if '.' in name:
+        return _build_selection(name)
+    return _get_node_selection(name)
+
 def unique_object_exists(name:str) -> bool:
     """
     Checks if a unique object with the given name exists in the current scene.
@@ -20,10 +66,9 @@ def unique_object_exists(name:str) -> bool:
 
     """
     try:
-        sel = om.MSelectionList()
-        sel.add(name)
+        _get_selection(name)
         return True
-    except:
+    except NameError:
         return False
 
 TApi = Union[om.MObject, om.MDagPath, om.MPlug, Tuple[om.MDagPath, om.MObject]]
@@ -41,46 +86,146 @@ def name_to_api(name:str, as_mobject:bool = False) -> TApi:
         MDagPath: if the given object is a DagNode
 
     """
-    if not unique_object_exists(name):
-        raise NameError('{} does not exist or is not unique'.format(name))
+    sel = _get_selection(name)
+    kind = _get_api_kind(name, sel)
+    if kind == _PLUG:
+        plug = sel.getPlug(0)
+        return plug.attribute() if as_mobject else plug
+    elif kind == _COMPONENT:
+        comp = sel.getComponent(0)
+        return comp[1] if as_mobject else comp
+    elif kind == _DAG:
+        dag = sel.getDagPath(0)
+        return dag.node() if as_mobject else dag
+    else:
+        return sel.getDependNode(0)
 
-    sel = om.MSelectionList()
-    sel.add(name)
+# The kinds of object a name can point to, see _get_api_kind
+_PLUG, _COMPONENT, _DAG, _DEPEND = range(4)
 
+def _get_api_kind(name:str, sel:om.MSelectionList) -> int:
+    """
+    Finds which kind of API object the given name points to, by probing the getters of its selection list. The kind
+    of node names is cached alongside their selection list, so that name_to_api only has to probe them once
+
+    Args:
+        name (str): the name of any maya object
+        sel (MSelectionList): the selection list holding the object
+
+    Returns:
+        int: _PLUG, _COMPONENT, _DAG or _DEPEND
+
+    Raises:
+        TypeError: the name contains a '.' but is neither an attribute nor a component
+    """
     if '.' in name:     # In that case we either have a Plug or a Component
         try:
-            plug = sel.getPlug(0)
-            if as_mobject:
-                return plug.attribute()
-            else:
-                return plug
+            sel.getPlug(0)
+            return _PLUG
         except TypeError:
             try:
-                comp = sel.getComponent(0)
-                if as_mobject:
-                    return comp[1]
-                else:
-                    return comp
+                sel.getComponent(0)
+                return _COMPONENT
             except RuntimeError:
                 raise TypeError(f'cannot find an attribute or a component named {name}')
-    else:       # Figure out if it's a DAG or DG
+    return _get_node_kind(name)
+
+@lru_cache(maxsize=4096)
+def _get_node_kind(name:str) -> int:
+    # Figure out if it's a DAG or DG
+    try:
+        _get_node_selection(name).getDagPath(0)
+        return _DAG
+    except TypeError:
+        return _DEPEND
+
+callbacks.dg_changed.connect(_get_node_kind.cache_clear)
+
+def name_to_plug(name:str) -> om.MPlug:
+    """
+    Finds the MPlug that corresponds to the given name. Faster than name_to_api when the caller knows it is looking
+    for an attribute, as it skips the type probing.
+
+    Args:
+        name (str): the name of an attribute
+
+    Returns:
+        MPlug: the plug matching the given name
+
+    Raises:
+        TypeError: the object is not an attribute
+    """
+    # Simple 'node.attr' names are resolved through the node, whose selection is cached and shared by all its
+    #  attributes. Nested, indexed or otherwise unusual names go through the full selection list parsing
+    node_name, sep, attr_name = name.partition('.')
+    if sep and '.' not in attr_name and '[' not in attr_name:
         try:
-            dag = sel.getDagPath(0)
-            if as_mobject:
-                return dag.node()
-            else:
-                return dag
-        except TypeError:
-            obj = sel.getDependNode(0)
-            return obj
+            node = _get_node_selection(node_name).getDependNode(0)
+            return om.MFnDependencyNode(node).findPlug(attr_name, False)
+        except (NameError, RuntimeError, TypeError):
+            pass
+
+    try:
+        return _get_selection(name).getPlug(0)
+    except TypeError:
+        raise TypeError(f'{name} is not an attribute')
+
+def name_to_dag(name:str) -> om.MDagPath:
+    """
+    Finds the MDagPath that corresponds to the given name. Faster than name_to_api when the caller knows it is looking
+    for a DAG node, as it skips the type probing.
+
+    Args:
+        name (str): the name of a DAG node
+
+    Returns:
+        MDagPath: the path matching the given name
+
+    Raises:
+        TypeError: the object is not a DAG node
+    """
+    try:
+        return _get_selection(name).getDagPath(0)
+    except TypeError:
+        raise TypeError(f'{name} is not a DAG Node')
+
+def name_to_mobject(name:str) -> om.MObject:
+    """
+    Finds the MObject of the node that corresponds to the given name. Faster than name_to_api when the caller knows
+    it is looking for a node, as it skips the type probing. If the name is an attribute or a component, the MObject of
+    its node is returned.
+
+    Args:
+        name (str): the name of a node
+
+    Returns:
+        MObject: the node matching the given name
+    """
+    return _get_selection(name).getDependNode(0)
+
+def commit_if(result:Union[TModifier, None]) -> Union[TModifier, None]:
+    """
+    Registers the given modifier in the undo queue, if there is one. Call this at the end of a function instead of
+    decorating it with api_undo to save a frame on hot paths.
+
+    Args:
+        result (MDGModifier, MDagModifier, AbstractModifier, None): the modifier to commit
+
+    Returns:
+        MDGModifier, MDagModifier, AbstractModifier, None: the given modifier
+    """
+    if result is not None:
+        undoqueue.commit(undo=result.undoIt, redo=result.doIt)
+    return result
 
 def api_undo(func):
+    """
+    Decorator that commits the modifier returned by the decorated function to the undo queue.
+    Prefer calling commit_if directly in performance sensitive code.
+    """
     @wraps(func)
     def wrapped(*args, **kwargs):
-        result = func(*args, **kwargs)
-        if result is not None:
-            apiundo.commit(undo=result.undoIt, redo=result.doIt)
-        return result
+        return commit_if(func(*args, **kwargs))
     return wrapped
 
 def get_plug_value(plug:om.MPlug, data_type:DataType=None, as_string:bool=False,
@@ -108,7 +253,8 @@ def get_plug_value(plug:om.MPlug, data_type:DataType=None, as_string:bool=False,
         TypeError: If the plug's data type is unsupported.
 
     Notes:
-        - Compound plugs are handled by recursively retrieving values for their child plugs.
+        - Numeric compound plugs (FLOAT2, FLOAT3...) are dispatched like any other type. Other compound plugs are
+          handled by recursively retrieving values for their child plugs.
         - For data types like DISTANCE, ANGLE, and TIME, unit conversions are performed based on the UI unit of the plug.
         - Enum plugs can optionally return their value as a string using the `as_string` flag.
         - Unsupported data types will result in a `TypeError`.
@@ -118,67 +264,19 @@ def get_plug_value(plug:om.MPlug, data_type:DataType=None, as_string:bool=False,
         - MATRIX: Values are extracted using `MFnMatrixData` and returned as an `MMatrix`.
         - MESSAGE: Returns the connected source node for destination plugs, or `None` if no connection exists.
     """
-    # In case of a compound, loop through all the children and return a list of all the values
-    if plug.isCompound:
-        num_children = plug.numChildren()
-        value = []
-        for x in range(num_children):
-            value.append(get_plug_value(plug, data_type=None, as_string=as_string, context=context))
-        return value
-
     # if the data type wasn't provided we need to figure it out
     if data_type is None:
         data_type = DataType.from_mobject(plug.attribute())
 
-    if data_type == DataType.DISTANCE:
-        d = plug.asMDistance(context)
-        return d.asUnits(d.uiUnit())
-
-    elif data_type == DataType.ANGLE:
-        a = plug.asMAngle(context)
-        return a.asUnits(a.uiUnit())
-
-    elif data_type == DataType.FLOAT:
-        return plug.asFloat(context)
-
-    elif data_type == DataType.BOOL:
-        return plug.asBool(context)
-
-    elif data_type == DataType.INT:
-        return plug.asInt(context)
-
-    elif data_type == DataType.ENUM:
-        if as_string:
-            e = om.MFnEnumAttribute(plug.attribute())
-            return e.fieldName(plug.asInt(context))
-        else:
-            return plug.asInt(context)
-
-    elif data_type == DataType.STRING:
-        return plug.asString(context)
-
-    elif data_type == DataType.TIME:
-        t = plug.asMTime(context)
-        return t.asUnits(t.uiUnit())
+    getter = _plug_getters.get(data_type)
+    if getter is not None:
+        return getter(plug, context, as_string)
 
-    elif data_type in (DataType.FLOAT2, DataType.FLOAT3, DataType.FLOAT4, DataType.INT2, DataType.INT3):
-        value = [get_plug_value(plug.child(x), context=context) for x in range(plug.numChildren())]
-        if data_type in (DataType.FLOAT3, DataType.INT3):
-            return om.MVector(value)
-        return value
-
-    elif data_type == DataType.MATRIX:
-        mobj = plug.asMObject(context)
-        matrix = om.MFnMatrixData(mobj).matrix()
-        return om.MMatrix(matrix)
+    # In case of a generic compound, loop through all the children and return a list of all the values
+    if plug.isCompound:
+        return [get_plug_value(plug.child(x), as_string=as_string, context=context) for x in range(plug.numChildren())]
 
-    elif data_type == DataType.MESSAGE:
-        if plug.isDestination:
-            return plug.source().node()
-        else:
-            return None
-    else:
-        raise TypeError('Unsupported plug type')
+    raise TypeError('Unsupported plug type')
 
 def set_plug_value(plug:om.MPlug, value:Any, data_type:DataType=None):
     # If the value is an MObject or MDataHandle, pass it directly to the corresponding method and don't ask questions
@@ -194,54 +292,150 @@ def set_plug_value(plug:om.MPlug, value:Any, data_type:DataType=None):
     if data_type is None:
         data_type = DataType.from_mobject(plug.attribute())
 
+    # Use the proper plug.setXXX method depending on the data type.
+    # Simple plugs are the most common case, so they are dispatched before querying the plug for compounds
+    setter = _plug_setters.get(data_type)
+    if setter is not None:
+        setter(plug, value)
+        return
+
     # Handle the compound case
     if plug.isCompound:
         num_children = plug.numChildren()
-        if len(value) >= num_children:
-            for x in range(num_children):
-                set_plug_value(plug=plug.child(x), value=value[x])
-            return
-        else:
+        get_child = plug.child
+        if len(value) < num_children:
             raise ValueError('Compound Attribute : value length does not match the amount of children')
 
-    # Use the proper plug.setXXX method depending on the data type.
-
-    if data_type == DataType.FLOAT:
-        plug.setFloat(plug, value)
-    elif data_type == DataType.INT:
-        plug.setInt(plug, value)
-    elif data_type == DataType.ENUM:
-        if isinstance(value, str):
-            mfn = om.MFnEnumAttribute(plug.attribute())
-            value = mfn.fieldValue(value)
-        plug.setInt(plug, value)
-    elif data_type == DataType.BOOL:
-        plug.setBool(plug, value)
-    elif data_type == DataType.ANGLE:
-        if not isinstance(value, om.MAngle):
-            value = DataType.to_angle(value)
-        plug.setMAngle(plug, value)
-    elif data_type == DataType.DISTANCE:
-        if not isinstance(value, om.MDistance):
-            value = DataType.to_distance(value)
-        plug.setMDistance(plug, value)
-    elif data_type == DataType.STRING:
-        if not isinstance(value, str):
-            value = DataType.to_string(value)
-        plug.setString(plug, value)
-    elif data_type == DataType.MATRIX:
-        if not isinstance(value, (om.MMatrix, om.MTransformationMatrix)):
-            value = DataType.to_matrix(value)
-        data = om.MFnMatrixData()
-        mobj = data.create(value)
-        set_plug_value(plug, mobj, DataType.MATRIX)
-    elif data_type == DataType.TIME:
-        if not isinstance(value, om.MTime):
-            value = DataType.to_time(value)
-        plug.setMTime(value)
+        if data_type in _numeric_compound_types:
+            # The children of numeric compounds are simple plugs, so we can dispatch them right away
+            for x in range(num_children):
+                child = get_child(x)
+                setter = _plug_setters.get(DataType.from_mobject(child.attribute()))
+                if setter is not None:
+                    setter(child, value[x])
+        else:
+            for x in range(num_children):
+                set_plug_value(plug=get_child(x), value=value[x])
+        return
 
 def prod_list(lst:List[int]):
     count = 1
     for n in lst:
         count *= n
     return count
+
+# plug.asXXX dispatch used by get_plug_value. Each getter takes the plug, the context and the as_string flag
+def _get_distance(plug:om.MPlug, context:om.MDGContext, as_string:bool) -> float:
+    d = plug.asMDistance(context)
+    return d.asUnits(d.uiUnit())
+
+def _get_angle(plug:om.MPlug, context:om.MDGContext, as_string:bool) -> float:
+    a = plug.asMAngle(context)
+    return a.asUnits(a.uiUnit())
+
+def _get_float(plug:om.MPlug, context:om.MDGContext, as_string:bool) -> float:
+    return plug.asFloat(context)
+
+def _get_bool(plug:om.MPlug, context:om.MDGContext, as_string:bool) -> bool:
+    return plug.asBool(context)
+
+def _get_int(plug:om.MPlug, context:om.MDGContext, as_string:bool) -> int:
+    return plug.asInt(context)
+
+def _get_enum(plug:om.MPlug, context:om.MDGContext, as_string:bool) -> Union[int, str]:
+    if as_string:
+        e = om.MFnEnumAttribute(plug.attribute())
+        return e.fieldName(plug.asInt(context))
+    else:
+        return plug.asInt(context)
+
+def _get_string(plug:om.MPlug, context:om.MDGContext, as_string:bool) -> str:
+    return plug.asString(context)
+
+def _get_time(plug:om.MPlug, context:om.MDGContext, as_string:bool) -> float:
+    t = plug.asMTime(context)
+    return t.asUnits(t.uiUnit())
+
+def _get_children(plug:om.MPlug, context:om.MDGContext, as_string:bool) -> List:
+    return [get_plug_value(plug.child(x), context=context) for x in range(plug.numChildren())]
+
+def _get_vector(plug:om.MPlug, context:om.MDGContext, as_string:bool) -> om.MVector:
+    # Unrolled, as the arity is known. The children still go through get_plug_value to handle their units
+    return om.MVector(get_plug_value(plug.child(0), context=context),
+                      get_plug_value(plug.child(1), context=context),
+                      get_plug_value(plug.child(2), context=context))
+
+def _get_matrix(plug:om.MPlug, context:om.MDGContext, as_string:bool) -> om.MMatrix:
+    mobj = plug.asMObject(context)
+    matrix = om.MFnMatrixData(mobj).matrix()
+    return om.MMatrix(matrix)
+
+def _get_message(plug:om.MPlug, context:om.MDGContext, as_string:bool) -> Union[om.MObject, None]:
+    if plug.isDestination:
+        return plug.source().node()
+    else:
+        return None
+
+_plug_getters = {DataType.DISTANCE: _get_distance,
+                 DataType.ANGLE: _get_angle,
+                 DataType.FLOAT: _get_float,
+                 DataType.BOOL: _get_bool,
+                 DataType.INT: _get_int,
+                 DataType.ENUM: _get_enum,
+                 DataType.STRING: _get_string,
+                 DataType.TIME: _get_time,
+                 DataType.FLOAT2: _get_children,
+                 DataType.FLOAT3: _get_vector,
+                 DataType.FLOAT4: _get_children,
+                 DataType.INT2: _get_children,
+                 DataType.INT3: _get_vector,
+                 DataType.MATRIX: _get_matrix,
+                 DataType.MESSAGE: _get_message}
+
+# plug.setXXX dispatch used by set_plug_value. Each setter takes the plug and the value, and converts the value to the
+#  type expected by the API if needed
+def _set_enum(plug:om.MPlug, value:Any):
+    if isinstance(value, str):
+        mfn = om.MFnEnumAttribute(plug.attribute())
+        value = mfn.fieldValue(value)
+    plug.setInt(value)
+
+def _set_angle(plug:om.MPlug, value:Any):
+    if not isinstance(value, om.MAngle):
+        value = DataType.to_angle(value)
+    plug.setMAngle(value)
+
+def _set_distance(plug:om.MPlug, value:Any):
+    if not isinstance(value, om.MDistance):
+        value = DataType.to_distance(value)
+    plug.setMDistance(value)
+
+def _set_string(plug:om.MPlug, value:Any):
+    if not isinstance(value, str):
+        value = DataType.to_string(value)
+    plug.setString(value)
+
+def _set_matrix(plug:om.MPlug, value:Any):
+    if not isinstance(value, (om.MMatrix, om.MTransformationMatrix)):
+        value = DataType.to_matrix(value)
+    data = om.MFnMatrixData()
+    plug.setMObject(data.create(value))
+
+def _set_time(plug:om.MPlug, value:Any):
+    if not isinstance(value, om.MTime):
+        value = DataType.to_time(value)
+    plug.setMTime(value)
+
+_plug_setters = {DataType.FLOAT: om.MPlug.setFloat,
+                 DataType.INT: om.MPlug.setInt,
+                 DataType.BOOL: om.MPlug.setBool,
+                 DataType.ENUM: _set_enum,
+                 DataType.ANGLE: _set_angle,
+                 DataType.DISTANCE: _set_distance,
+                 DataType.STRING: _set_string,
+                 DataType.MATRIX: _set_matrix,
+                 DataType.TIME: _set_time}
+
+# Compound data types whose children are all simple plugs
+_numeric_compound_types = frozenset((DataType.FLOAT2, DataType.FLOAT3, DataType.FLOAT4, DataType.INT2, DataType.INT3,
+                                     DataType.COLOR))
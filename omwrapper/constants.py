@@ -1,10 +1,95 @@
 from enum import Enum
-from typing import List, Union, Any, Tuple, Type
+from itertools import chain
+from typing import List, Union, Any, Tuple, Type, Dict, Optional
 
 from maya.api import OpenMaya as om
 
+from omwrapper.api import callbacks
+
+# API constants and function sets used on hot paths, bound once to skip the attribute chains on each call
+_kBoolean = om.MFnNumericData.kBoolean
+_kShort = om.MFnNumericData.kShort
+_kInt = om.MFnNumericData.kInt
+_kLong = om.MFnNumericData.kLong
+_kByte = om.MFnNumericData.kByte
+_kFloat = om.MFnNumericData.kFloat
+_kDouble = om.MFnNumericData.kDouble
+_kAddr = om.MFnNumericData.kAddr
+_kString = om.MFnData.kString
+_kMatrix = om.MFnData.kMatrix
+_kCompoundAttribute = om.MFn.kCompoundAttribute
+# Function sets shared by the DataType resolution, rebound with setObject instead of being created for every attribute.
+#  The Maya API is only used from the main thread, so they don't need to be thread local
+_fn_attribute = om.MFnAttribute()
+_fn_numeric_attribute = om.MFnNumericAttribute()
+_fn_typed_attribute = om.MFnTypedAttribute()
+_MPoint = om.MPoint
+_MVector = om.MVector
+
+_MDistance = om.MDistance
+_MAngle = om.MAngle
+_MTime = om.MTime
+
+# radians per angle unit, used by DataType.to_euler
+_radians_per_angle_unit = {unit: _MAngle(1.0, unit).asRadians()
+                           for unit in (_MAngle.kRadians, _MAngle.kDegrees, _MAngle.kAngMinutes, _MAngle.kAngSeconds)}
+
+_sequence_types = (list, tuple)
+
+_int_numeric_types = frozenset((_kShort, _kInt, _kLong, _kByte))
+_float_numeric_types = frozenset((_kFloat, _kDouble, _kAddr))
+
+def _build_value_table(enum_class: Type[Enum], mapping: Dict[Enum, Any]) -> Tuple[Any, ...]:
+    """
+    Converts a mapping keyed by the members of an Enum with small, dense int values into a tuple indexed by these
+    values, so that lookups skip hashing the members. Members missing from the mapping are filled with None
+
+    Args:
+        enum_class (Type[Enum]): the Enum class the mapping is keyed with
+        mapping (dict): the mapping to convert
+
+    Returns:
+        tuple: the values of the mapping, indexed by the value of their key
+
+    """
+    table = [None] * (max(member._value_ for member in enum_class) + 1)
+    for member, value in mapping.items():
+        table[member._value_] = value
+    return tuple(table)
+
+# Results of MFnMixin.from_mobject, keyed by the Enum class and the api type of the object
+_from_mobject_cache: Dict[Tuple[type, int], Optional[Enum]] = {}
+
+
 class MFnMixin:
-    #ToDo: add a from_MObject method maybe ?
+    @classmethod
+    def from_mobject(cls, MObject: om.MObject) -> Optional[Enum]:
+        """
+        Gets the first member, in definition order, whose MFn constant is supported by the given MObject
+        Args:
+            MObject (MObject): the object to test
+
+        Returns:
+            Enum: the first matching member, or None if the MObject matches none of them
+
+        """
+        # hasFn only depends on the api type of the object, so the result is memoized per (class, api type) to avoid
+        #  probing every member again for objects of a type that was already seen
+        key = (cls, MObject.apiType())
+        try:
+            return _from_mobject_cache[key]
+        except KeyError:
+            pass
+
+        has_fn = MObject.hasFn
+        result = None
+        for value, member in cls._value2member_map_.items():
+            if has_fn(value):
+                result = member
+                break
+        _from_mobject_cache[key] = result
+        return result
+
     @classmethod
     def from_mfn(cls, value: int) -> Enum:
         """
@@ -16,10 +101,11 @@ class MFnMixin:
             ObjectType: the converted result
 
         """
+        # The member map is queried directly, as calling the Enum class goes through the EnumMeta machinery
         try:
-            return cls(value)
-        except ValueError:
-            raise ValueError(f'No matching ObjectType for MFn constant {value}')
+            return cls._value2member_map_[value]
+        except KeyError:
+            raise ValueError(f'No matching {cls.__name__} for MFn constant {value}')
 
     @classmethod
     def to_mfn(cls, value: Enum) -> int:
@@ -32,17 +118,18 @@ class MFnMixin:
             MFn constant: the converted result
 
         """
-        return value.value
+        # _value_ is read directly, as the value property of Enum members is much slower than a plain attribute
+        return value._value_
 
+    # The MFn enums don't define aliases, so the member maps hold exactly the members, in definition order, and can be
+    #  iterated directly instead of going through a generator
     @classmethod
     def iter_members(cls):
-        for member in cls:
-            yield member
+        return iter(cls._member_map_.values())
 
     @classmethod
     def iter_mfn(cls):
-        for member in cls:
-            yield cls.to_mfn(member)
+        return iter(cls._value2member_map_)
 
 
 class AttributeType(MFnMixin, Enum):
@@ -113,6 +200,10 @@ class DataType(Enum):
     def from_mobject(cls, MObject: om.MObject) -> "DataType":
         """
         Gets a DataType from the given API MObject.
+        Most api types map to a single DataType and are resolved with one lookup. Results for the types that need the
+        function set of the attribute (numeric, typed and 3 float attributes) are cached per attribute, keyed by the
+        hash code of its MObjectHandle. The cache is cleared whenever a new scene is created or opened, or with
+        clear_data_type_cache.
 
         Args:
             MObject (MObject): The API object to get the data type for.
@@ -121,139 +212,146 @@ class DataType(Enum):
             DataType: The data type of the object.
         """
         api_type = MObject.apiType()
-        if api_type in [om.MFn.kDoubleLinearAttribute, om.MFn.kFloatLinearAttribute]:
-            return cls.DISTANCE
-        elif api_type in [om.MFn.kDoubleAngleAttribute, om.MFn.kFloatAngleAttribute]:
-            return cls.ANGLE
-        elif api_type == om.MFn.kNumericAttribute:
-            return cls._from_numeric(om.MFnNumericAttribute(MObject))
-        elif api_type in [om.MFn.kAttribute2Double, om.MFn.kAttribute2Float]:
-            return cls.FLOAT2
-        elif api_type in [om.MFn.kAttribute3Double, om.MFn.kAttribute3Float]:
-            mfn = om.MFnAttribute(MObject)
-            if mfn.usedAsColor:
-                return cls.COLOR
-            return cls.FLOAT3
-        elif api_type == om.MFn.kAttribute4Double:
-            return cls.FLOAT4
-        elif api_type in [om.MFn.kAttribute2Int, om.MFn.kAttribute2Short]:
-            return cls.INT2
-        elif api_type in [om.MFn.kAttribute3Int, om.MFn.kAttribute3Short]:
-            return cls.INT3
-        elif api_type == om.MFn.kTypedAttribute:
-            return cls._from_typed(om.MFnTypedAttribute(MObject))
-        elif api_type == om.MFn.kMatrixAttribute:
-            return cls.MATRIX
-        elif api_type == om.MFn.kEnumAttribute:
-            return cls.ENUM
-        elif api_type == om.MFn.kTimeAttribute:
-            return cls.TIME
-        elif api_type == om.MFn.kMessageAttribute:
-            return cls.MESSAGE
-        else:
+        data_type = api_type_to_data_type.get(api_type)
+        if data_type is not None:
+            return data_type
+        resolver = api_type_to_data_type_resolver.get(api_type)
+        if resolver is None:
             return cls.INVALID
 
+        handle = om.MObjectHandle(MObject)
+        key = handle.hashCode()
+        cached = _data_type_cache.get(key)
+        # The handle is kept alongside the result so that an entry left by a deleted attribute can be detected
+        if cached is not None and cached[0].isValid():
+            return cached[1]
+
+        data_type = resolver(MObject)
+        if len(_data_type_cache) >= DATA_TYPE_CACHE_SIZE:
+            _data_type_cache.clear()
+        _data_type_cache[key] = (handle, data_type)
+        return data_type
+
+    @classmethod
+    def _from_float3(cls, MObject: om.MObject) -> "DataType":
+        """
+        Determines whether a 3 float attribute is a color or not.
+
+        Args:
+            MObject (MObject): The attribute to analyze.
+
+        Returns:
+            DataType: COLOR or FLOAT3
+        """
+        _fn_attribute.setObject(MObject)
+        return cls.COLOR if _fn_attribute.usedAsColor else cls.FLOAT3
+
     @classmethod
-    def _from_numeric(cls, mfn: om.MFnNumericAttribute) -> "DataType":
+    def _from_numeric(cls, MObject: om.MObject) -> "DataType":
         """
         Determines the DataType from a numeric attribute.
 
         Args:
-            mfn (MFnNumericAttribute): The numeric attribute to analyze.
+            MObject (MObject): The numeric attribute to analyze.
 
         Returns:
             DataType: The corresponding data type.
         """
+        mfn = _fn_numeric_attribute
+        mfn.setObject(MObject)
         api_type = mfn.numericType()
-        if api_type == om.MFnNumericData.kBoolean:
+        if api_type == _kBoolean:
             return cls.BOOL
-        elif api_type in [om.MFnNumericData.kShort, om.MFnNumericData.kInt, om.MFnNumericData.kLong, om.MFnNumericData.kByte]:
+        elif api_type in _int_numeric_types:
             return cls.INT
-        elif api_type in [om.MFnNumericData.kFloat, om.MFnNumericData.kDouble, om.MFnNumericData.kAddr]:
+        elif api_type in _float_numeric_types:
             return cls.FLOAT
         else:
-            raise TypeError(f'Type {mfn.object().apiTypeStr} not supported')
+            raise TypeError(f'Type {MObject.apiTypeStr} not supported')
 
     @classmethod
-    def _from_typed(cls, mfn: om.MFnTypedAttribute) -> "DataType":
+    def _from_typed(cls, MObject: om.MObject) -> "DataType":
         """
         Determines the DataType from a typed attribute.
 
         Args:
-            mfn (MFnTypedAttribute): The typed attribute to analyze.
+            MObject (MObject): The typed attribute to analyze.
 
         Returns:
             DataType: The corresponding data type.
         """
+        mfn = _fn_typed_attribute
+        mfn.setObject(MObject)
         api_type = mfn.attrType()
-        if api_type == om.MFnData.kString:
+        if api_type == _kString:
             return cls.STRING
-        elif api_type == om.MFnData.kMatrix:
+        elif api_type == _kMatrix:
             return cls.MATRIX
         else:
-            raise TypeError(f'Type {mfn.object().apiTypeStr} not supported')
+            raise TypeError(f'Type {MObject.apiTypeStr} not supported')
 
     @classmethod
-    def to_distance(cls, value: float, unit: int = om.MDistance.uiUnit()) -> om.MDistance:
+    def to_distance(cls, value: float, unit: Optional[int] = None) -> om.MDistance:
         """
         Converts a value to a distance.
 
         Args:
             value (float): The value to convert.
-            unit (int, optional): The unit to use. Defaults to MDistance.uiUnit().
+            unit (int, optional): The unit to use. Defaults to the current MDistance.uiUnit().
 
         Returns:
             om.MDistance: The converted distance object.
         """
-        result = om.MDistance(value, unit)
-        return result
+        return _MDistance(value, _MDistance.uiUnit() if unit is None else unit)
 
     @classmethod
-    def to_angle(cls, value: float, unit: int = om.MAngle.uiUnit()) -> om.MAngle:
+    def to_angle(cls, value: float, unit: Optional[int] = None) -> om.MAngle:
         """
         Converts a value to an angle.
 
         Args:
             value (float): The value to convert.
-            unit (int, optional): The unit to use. Defaults to MAngle.uiUnit().
+            unit (int, optional): The unit to use. Defaults to the current MAngle.uiUnit().
 
         Returns:
             MAngle: The converted angle object.
         """
-        result = om.MAngle(value, unit)
-        return result
+        return _MAngle(value, _MAngle.uiUnit() if unit is None else unit)
 
     @classmethod
-    def to_euler(cls, value: List[float], order: int = om.MEulerRotation.kXYZ) -> om.MEulerRotation:
+    def to_euler(cls, value: List[float], order: int = om.MEulerRotation.kXYZ,
+                 unit: Optional[int] = None) -> om.MEulerRotation:
         """
         Converts a value to an Euler rotation.
 
         Args:
             value (list): A sequence of 3 floats representing the rotation.
             order (int, optional): The order of rotation. Defaults to MEulerRotation.kXYZ.
+            unit (int, optional): The angle unit of the values. Defaults to the current MAngle.uiUnit().
 
         Returns:
             MEulerRotation: The converted Euler rotation object.
+
+        Raises:
+            ValueError: If the value is not a sequence of 3 floats.
         """
-        assert len(value) == 3, 'Value must be a sequence of 3 floats'
-        comp = [cls.to_angle(v).asRadians() for v in value]
-        comp.append(order)
-        return om.MEulerRotation(*comp)
+        x, y, z = value
+        factor = _radians_per_angle_unit[_MAngle.uiUnit() if unit is None else unit]
+        return om.MEulerRotation(x * factor, y * factor, z * factor, order)
 
     @classmethod
-    def to_time(cls, value: float, unit: int = om.MTime.uiUnit()) -> om.MTime:
+    def to_time(cls, value: float, unit: Optional[int] = None) -> om.MTime:
         """
         Converts a value to a time object.
 
         Args:
             value (float): The value to convert.
-            unit (int, optional): The unit to use. Defaults to om.MTime.uiUnit().
+            unit (int, optional): The unit to use. Defaults to the current MTime.uiUnit().
 
         Returns:
             MTime: The converted time object.
         """
-        result = om.MTime(value, unit)
-        return result
+        return _MTime(value, _MTime.uiUnit() if unit is None else unit)
 
     @classmethod
     def to_matrix(cls, value: Union[List[float], List[List[float]]]) -> om.MMatrix:
@@ -269,16 +367,13 @@ class DataType(Enum):
         Raises:
             ValueError: If the value does not represent a matrix.
         """
-        if isinstance(value, (list, tuple)):
-            if len(value) == 4 and all(isinstance(x, (list, tuple)) for x in value):
-                value = [item for sublist in value for item in sublist]  # Flatten list of lists
-                return om.MMatrix(value)
-            elif len(value) == 16:
+        if isinstance(value, _sequence_types):
+            length = len(value)
+            if length == 16:
                 return om.MMatrix(value)
-            else:
-                raise ValueError(f'{value} does not represent a matrix')
-        else:
-            raise ValueError(f'{value} does not represent a matrix')
+            elif length == 4 and all(isinstance(row, _sequence_types) for row in value):
+                return om.MMatrix(list(chain.from_iterable(value)))  # Flatten list of lists
+        raise ValueError(f'{value} does not represent a matrix')
 
     @classmethod
     def to_string(cls, value: Any) -> str:
@@ -305,10 +400,10 @@ class DataType(Enum):
         Returns:
             MPoint: The converted point object.
         """
-        if isinstance(value, om.MPoint):
+        if isinstance(value, _MPoint):
             return value
         else:
-            return om.MPoint(value)
+            return _MPoint(value)
 
     @classmethod
     def to_vector(cls, value: Union[om.MVector, List[float]]) -> om.MVector:
@@ -321,10 +416,10 @@ class DataType(Enum):
         Returns:
             MVector: The converted vector object.
         """
-        if isinstance(value, om.MVector):
+        if isinstance(value, _MVector):
             return value
         else:
-            return om.MVector(value)
+            return _MVector(value)
 
     @classmethod
     def numeric(cls) -> Tuple["DataType", ...]:
@@ -335,9 +430,7 @@ class DataType(Enum):
             list: all numeric data types
 
         """
-        return cls.FLOAT, cls.FLOAT2, cls.FLOAT3, cls.FLOAT4, \
-               cls.INT, cls.INT2, cls.INT3, \
-               cls.BOOL
+        return _numeric_data_types
 
     @classmethod
     def unit(cls) -> Tuple["DataType", ...]:
@@ -348,7 +441,7 @@ class DataType(Enum):
             list: all unit data types
 
         """
-        return cls.DISTANCE, cls.ANGLE, cls.TIME
+        return _unit_data_types
 
     @classmethod
     def to_api_type(cls, constant:"DataType") -> int:
@@ -362,9 +455,61 @@ class DataType(Enum):
         Returns:
             int: the MFnUnitAttribute or MFnNumericAttribute matching the input DataType
 
+        Raises:
+            TypeError: if the DataType is not a numeric or unit type
+
         """
-        assert constant in cls.numeric() or constant in cls.unit(), f'{constant} is not a Numeric or Unit Type'
-        return data_types_to_api[constant]
+        result = _data_types_to_api_table[constant._value_]
+        if result is None:
+            raise TypeError(f'{constant} is not a Numeric or Unit Type')
+        return result
+
+_numeric_data_types = (DataType.FLOAT, DataType.FLOAT2, DataType.FLOAT3, DataType.FLOAT4,
+                       DataType.INT, DataType.INT2, DataType.INT3,
+                       DataType.BOOL)
+_unit_data_types = (DataType.DISTANCE, DataType.ANGLE, DataType.TIME)
+# frozensets used for membership tests, the tuples above are kept for DataType.numeric and DataType.unit
+numeric_data_types = frozenset(_numeric_data_types)
+unit_data_types = frozenset(_unit_data_types)
+
+# api types that directly match a DataType
+api_type_to_data_type = {om.MFn.kDoubleLinearAttribute: DataType.DISTANCE,
+                         om.MFn.kFloatLinearAttribute: DataType.DISTANCE,
+                         om.MFn.kDoubleAngleAttribute: DataType.ANGLE,
+                         om.MFn.kFloatAngleAttribute: DataType.ANGLE,
+                         om.MFn.kAttribute2Double: DataType.FLOAT2,
+                         om.MFn.kAttribute2Float: DataType.FLOAT2,
+                         om.MFn.kAttribute4Double: DataType.FLOAT4,
+                         om.MFn.kAttribute2Int: DataType.INT2,
+                         om.MFn.kAttribute2Short: DataType.INT2,
+                         om.MFn.kAttribute3Int: DataType.INT3,
+                         om.MFn.kAttribute3Short: DataType.INT3,
+                         om.MFn.kMatrixAttribute: DataType.MATRIX,
+                         om.MFn.kEnumAttribute: DataType.ENUM,
+                         om.MFn.kTimeAttribute: DataType.TIME,
+                         om.MFn.kMessageAttribute: DataType.MESSAGE}
+
+# api types that need to inspect the attribute to find the DataType
+api_type_to_data_type_resolver = {
+    om.MFn.kNumericAttribute: DataType._from_numeric,
+    om.MFn.kAttribute3Double: DataType._from_float3,
+    om.MFn.kAttribute3Float: DataType._from_float3,
+    om.MFn.kTypedAttribute: DataType._from_typed}
+
+DATA_TYPE_CACHE_SIZE = 1024
+_data_type_cache: Dict[int, Tuple[om.MObjectHandle, DataType]] = {}
+
+def clear_data_type_cache():
+    """
+    Clears the cache used by DataType.from_mobject
+
+    Returns:
+        None
+
+    """
+    _data_type_cache.clear()
+
+callbacks.scene_changed.connect(clear_data_type_cache)
 
 data_types_to_api = {DataType.DISTANCE: om.MFnUnitAttribute.kDistance,
                      DataType.ANGLE: om.MFnUnitAttribute.kAngle,
@@ -377,6 +522,7 @@ data_types_to_api = {DataType.DISTANCE: om.MFnUnitAttribute.kDistance,
                      DataType.INT: om.MFnNumericData.kInt,
                      DataType.INT2: om.MFnNumericData.k2Int,
                      DataType.INT3: om.MFnNumericData.k3Int}
+_data_types_to_api_table = _build_value_table(DataType, data_types_to_api)
 
 class AttrType(Enum):
     INVALID = 0
@@ -400,40 +546,53 @@ class AttrType(Enum):
         Returns:
             AttrType: The corresponding attribute type. If no match is found, INVALID is returned.
         """
-
-        if data_type in DataType.numeric():
-            return cls.NUMERIC
-        elif data_type in DataType.unit():
-            return cls.UNIT
-        elif data_type == DataType.ENUM:
-            return cls.ENUM
-        elif data_type == DataType.MATRIX:
-            return cls.MATRIX
-        elif data_type == DataType.MESSAGE:
-            return cls.MESSAGE
-        elif data_type == DataType.STRING:
-            return cls.STRING
-        else:
+        result = _data_types_to_attr_type_table[data_type._value_]
+        if result is None:
             return cls.INVALID
+        return result
 
     @classmethod
-    def from_mobject(cls, MObject:om.MObject) -> "AttrType":
-        data_type = DataType.from_mobject(MObject)
+    def from_mobject(cls, MObject:om.MObject, data_type:Optional[DataType]=None) -> "AttrType":
+        """
+        Gets the AttrType of the given attribute MObject.
+
+        Args:
+            MObject (MObject): The attribute to get the type for.
+            data_type (DataType, optional): The DataType of the attribute, if it is already known. Resolved from the
+                MObject otherwise.
+
+        Returns:
+            AttrType: The attribute type. If no match is found, INVALID is returned.
+        """
+        if data_type is None:
+            data_type = DataType.from_mobject(MObject)
         if data_type is not DataType.INVALID:
             return cls.from_data_type(data_type)
 
         api_type = MObject.apiType()
-        if api_type == om.MFn.kCompoundAttribute:
+        if api_type == _kCompoundAttribute:
             return cls.COMPOUND
         else:
             return cls.INVALID
 
     @classmethod
     def to_function_set(cls, constant:"AttrType") -> Type[om.MFnAttribute]:
-        fn = attr_type_to_function_set.get(constant)
-        if fn is None:
+        """
+        Gets the function set class used to create attributes of the given AttrType.
+
+        Args:
+            constant (AttrType): The attribute type to get the function set for.
+
+        Returns:
+            Type[MFnAttribute]: The function set class.
+
+        Raises:
+            TypeError: If no function set matches the attribute type.
+        """
+        result = _attr_type_to_function_set_table[constant._value_]
+        if result is None:
             raise TypeError(f'No function set found for AttrType {constant.name}')
-        return fn
+        return result
 
 attr_type_to_function_set = {AttrType.COMPOUND: om.MFnCompoundAttribute,
                              AttrType.ENUM: om.MFnEnumAttribute,
@@ -443,3 +602,12 @@ attr_type_to_function_set = {AttrType.COMPOUND: om.MFnCompoundAttribute,
                              AttrType.STRING: om.MFnTypedAttribute,
                              AttrType.NUMERIC: om.MFnNumericAttribute,
                              AttrType.UNIT: om.MFnUnitAttribute}
+_attr_type_to_function_set_table = _build_value_table(AttrType, attr_type_to_function_set)
+
+data_types_to_attr_type = {DataType.ENUM: AttrType.ENUM,
+                           DataType.MATRIX: AttrType.MATRIX,
+                           DataType.MESSAGE: AttrType.MESSAGE,
+                           DataType.STRING: AttrType.STRING}
+data_types_to_attr_type.update(dict.fromkeys(_numeric_data_types, AttrType.NUMERIC))
+data_types_to_attr_type.update(dict.fromkeys(_unit_data_types, AttrType.UNIT))
+_data_types_to_attr_type_table = _build_value_table(DataType, data_types_to_attr_type)
@@ -1,19 +1,18 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from functools import wraps
-from typing import Dict, List, Union, Any, Optional, Iterable, Tuple, TYPE_CHECKING, ParamSpec, Callable
+from typing import Dict, List, Union, Any, Optional, Iterable, Tuple, TYPE_CHECKING, Callable
 
 from maya.api import OpenMaya as om
 
-from omwrapper.api import apiundo
+from omwrapper.api import undoqueue, callbacks
 from omwrapper.api.modifiers.base import add_modifier
 from omwrapper.api.modifiers.custom import ProxyModifier
 from omwrapper.api.modifiers.maya import DGModifier, DagModifier
-from omwrapper.api.utilities import get_plug_value, set_plug_value, name_to_api
+from omwrapper.api.utilities import get_plug_value, set_plug_value, name_to_plug
 from omwrapper.constants import DataType, AttrType
-from omwrapper.entities.base import MayaObject, TMayaObjectApi, recycle_mfn, undoable_proxy_wrap
-from omwrapper.pytools import Iterator
+from omwrapper.entities.base import MayaObject, TMayaObjectApi, undoable_proxy_wrap
 
 if TYPE_CHECKING:
     from omwrapper.entities.nodes.dependency import DependNode
@@ -25,35 +24,62 @@ TDefaultValues = Union[int, float, str, bool, List[Union[int, float]]]
 TEnumField = List[Tuple[str, int]]
 TQuantifiableFn = Union[om.MFnNumericAttribute, om.MFnUnitAttribute]
 
-#ToDo: update this like recycle_mfn to make it work with the undoable_proxy_wrap
-def recycle_mplug(func):
-    @wraps(func)
-    def wrapped(*args, **kwargs):
-        inst = args[0]
-        mfn = kwargs.get('mplug', None)
-        if mfn is None:
-            kwargs['mplug'] = inst.api_mplug()
-        result = func(*args, **kwargs)
-        return result
-    return wrapped
-
 TTime = Union[float, int, om.MTime]
 
+_normal_context = om.MDGContext.kNormal
+# The context used by Attribute.get when neither a time nor a context is given, see Attribute.eval_at
+_eval_context = _normal_context
+
+# The UI time unit used to build contexts from plain numbers. Queried lazily and reset by the time_unit_changed signal
+_ui_time_unit: Optional[int] = None
+
+def _reset_ui_time_unit():
+    global _ui_time_unit
+    _ui_time_unit = None
+
+callbacks.time_unit_changed.connect(_reset_ui_time_unit)
+
+def _time_to_context(time:TTime) -> om.MDGContext:
+    global _ui_time_unit
+    if isinstance(time, om.MTime):
+        return om.MDGContext(time)
+    unit = _ui_time_unit
+    if unit is None:
+        unit = _ui_time_unit = om.MTime.uiUnit()
+    return om.MDGContext(om.MTime(time, unit=unit))
+
+# Values returned by Attribute.is_free_to_change for each MPlug.isFreeToChange state, anything else being
+#  kChildrenNotFreeToChange
+_free_to_change_states = {om.MPlug.kFreeToChange: 1, om.MPlug.kNotFreeToChange: 0}
+
+def _commit_modifier(modifier:DGModifier):
+    # Executes a modifier created by one of the Attribute methods and registers it in the undo queue. This does the
+    #  same as the add_modifier decorator, inlined in the most frequently called methods to save the wrapper call
+    modifier.doIt()
+    undoqueue.commit(modifier.undoIt, modifier.doIt)
+
+# Conversion functions for the exact types accepted by _as_mplug. MPlug and str are never subclassed in practice, so
+#  looking up the exact type covers nearly every call with a single dict probe
+_as_mplug_converters = {om.MPlug: lambda plug: plug,
+                        str: name_to_plug}
+
 def _as_mplug(attribute:TConnect) -> om.MPlug:
-    if isinstance(attribute, Attribute):
+    converter = _as_mplug_converters.get(type(attribute))
+    if converter is not None:
+        return converter(attribute)
+    # Attribute has many subclasses, including user classes, and needs isinstance
+    elif isinstance(attribute, Attribute):
         return attribute.api_mplug()
     elif isinstance(attribute, om.MPlug):
         return attribute
     elif isinstance(attribute, str):
-        obj = name_to_api(attribute)
-        if isinstance(obj, om.MPlug):
-            return obj
-        else:
-            raise TypeError(f'{attribute} is not an attribute')
+        return name_to_plug(attribute)
     else:
         raise TypeError(f'The type of {attribute} ({type(attribute)}) is not supported')
 
 class Attribute(MayaObject):
+    # The child attributes cached by __getattr__ still go to the __dict__ provided by MayaObject
+    __slots__ = ('_mplug', '_node', '_parent', '_data_type', '_attr_type', '_mfn', '_is_array')
     _mfn_class = om.MFnAttribute
     _mfn_constant = om.MFn.kAttribute
 
@@ -61,8 +87,12 @@ class Attribute(MayaObject):
         self._node = kwargs.pop('node', None)
         self._parent = kwargs.pop('parent', None)
         super().__init__(**kwargs)
+        # The plug is read by nearly every method, keep it at hand rather than looking it up in _api_input each time
+        self._mplug = kwargs['MPlug']
         self._data_type = None
         self._attr_type = None
+        self._mfn = None
+        self._is_array = None
 
     def __getattr__(self, item) -> Attribute:
         if not self.has_attr(item):
@@ -73,28 +103,28 @@ class Attribute(MayaObject):
 
     # API STUFF
     def api_mfn(self) -> om.MFnBase:
-        return self._mfn_class(self.api_mobject())
+        # The attribute MObject never changes for a given instance, so the function set is built once and reused
+        mfn = self._mfn
+        if mfn is None:
+            mfn = self._mfn = self._mfn_class(self.api_mobject())
+        return mfn
 
     def api_mplug(self) -> om.MPlug:
-        return self._api_input['MPlug']
+        return self._mplug
 
     def api_object(self) -> om.MPlug:
         return self.api_mplug()
 
     @classmethod
     def get_build_data_from_name(cls, name:str) -> Dict[str, TMayaObjectApi]:
-        sel = om.MSelectionList()
-        sel.add(name)
-
         try:
-            mplug = sel.getPlug(0)
+            mplug = name_to_plug(name)
         except TypeError:
             raise TypeError(f'{name} is not a valid attribute')
 
         return {'MObjectHandle':om.MObjectHandle(mplug.attribute()), 'MPlug':mplug}
 
     # IDENTITY
-    @recycle_mplug
     def name(self, include_node=True, full_dag_path=False, alias=False, full_attr_path=False, long_names=True, mplug:om.MPlug=None) -> str:
         """
         Generates the name of the attribute.
@@ -110,11 +140,13 @@ class Attribute(MayaObject):
             long_names (bool, optional): If True, uses the long names of attributes instead of
                 their short names. Defaults to True.
             mplug (MPlug, optional): The MPlug to retrieve the name from. If not provided, the
-                decorator or other logic may handle the setup. Defaults to None.
+                plug of this attribute is used. Defaults to None.
 
         Returns:
             str: The computed plug name as a string, based on the specified parameters.
         """
+        if mplug is None:
+            mplug = self._mplug
         name = ''
         if include_node or full_dag_path:
             name = f'{self.node().name(full_dag_path=full_dag_path)}.'
@@ -123,7 +155,6 @@ class Attribute(MayaObject):
         name += plug_name
         return name
 
-    @recycle_mfn
     def attr_name(self, long_name:bool=True, mfn:om.MFnAttribute=None) -> str:
         """
         Retrieves the name of an attribute, either its long name or short name.
@@ -132,37 +163,66 @@ class Attribute(MayaObject):
             long_name (bool, optional): If True, returns the attribute's long name. If False, returns its short name.
                 Defaults to True.
             mfn (MFnAttribute, optional): The attribute function set (`MFnAttribute`) to retrieve the name from.
-                If not provided, the decorator or other logic may handle the setup. Defaults to None.
+                If not provided, the function set of this attribute is used. Defaults to None.
 
         Returns:
             str: The attribute's name, either its long name or short name, based on the `long_name` parameter.
         """
-        if long_name:
-            name = mfn.name
-        else:
-            name = mfn.shortName
-        return name
+        if mfn is None:
+            mfn = self.api_mfn()
+        return mfn.name if long_name else mfn.shortName
 
     def node(self) -> DependNode:
         if self._node is None:
-            handle = om.MObjectHandle(self.api_mplug().node())
+            handle = om.MObjectHandle(self._mplug.node())
             self._node = self._factory(MObjectHandle=handle)
         return self._node
 
-    @recycle_mplug
-    def parent(self, mplug:om.MPlug):
-        if self._parent is not None:
-            return self._parent
+    def _connected_attributes(self, plugs:Iterable[om.MPlug], node_mobject:om.MObject) -> List[Attribute]:
+        """
+        Wraps the plugs connected to this attribute into Attributes. Plugs that live on the same node as this attribute
+        reuse its node instead of building a new one
+
+        Args:
+            plugs (Iterable[MPlug]): the connected plugs
+            node_mobject (MObject): the node of this attribute's plug
+
+        Returns:
+            List[Attribute]: the Attributes representing the given plugs
+        """
+        factory = self._factory
+        node = None
+        result = []
+        for plug in plugs:
+            if plug.node() == node_mobject:
+                if node is None:
+                    node = self.node()
+                result.append(factory(plug, node=node))
+            else:
+                result.append(factory(plug))
+        return result
+
+    def parent(self, mplug:om.MPlug=None):
+        # The parent of a plug never changes, so the one of this attribute is only built once
+        own_plug = mplug is None
+        if own_plug:
+            if self._parent is not None:
+                return self._parent
+            mplug = self._mplug
 
         try:
             parent_plug = mplug.parent()
         except TypeError:
             return None
         parent_mobject = parent_plug.attribute()
-        return self._factory(MPlug=parent_plug, MObjectHandle=om.MObjectHandle(parent_mobject), node=self.node())
+        parent = self._factory(MPlug=parent_plug, MObjectHandle=om.MObjectHandle(parent_mobject), node=self.node())
+        if own_plug:
+            self._parent = parent
+        return parent
 
-    @recycle_mfn
     def rename(self, name:str, short_name=False, mfn:om.MFnAttribute=None):
+        if mfn is None:
+            mfn = self.api_mfn()
         if short_name:
             mfn.shortName = name
         else:
@@ -176,7 +236,13 @@ class Attribute(MayaObject):
 
     def data_type(self) -> AttrType:
         if self._attr_type is None:
-            self._attr_type = AttrType.from_mobject(self.api_mobject())
+            # DataType.from_mobject caches its results across instances, reuse it rather than resolving it again, and
+            #  fetch the MObject only once for both lookups
+            mobj = self.api_mobject()
+            data_type = self._data_type
+            if data_type is None:
+                data_type = self._data_type = DataType.from_mobject(mobj)
+            self._attr_type = AttrType.from_mobject(mobj, data_type=data_type)
         return self._attr_type
 
     def attr(self, name):
@@ -205,8 +271,7 @@ class Attribute(MayaObject):
         return False
 
     # PARAMETERS
-    @recycle_mplug
-    def index(self, mplug) -> int:
+    def index(self, mplug=None) -> int:
         """
         if this is a multi attribute, return the index of this particular element
         Args:
@@ -216,174 +281,204 @@ class Attribute(MayaObject):
             int: the index of this attribute
 
         """
+        if mplug is None:
+            mplug = self._mplug
         return mplug.logicalIndex()
 
-    @recycle_mplug
-    def multi_indices(self, mplug:om.MPlug) -> List[int]:
+    def multi_indices(self, mplug:om.MPlug=None) -> List[int]:
+        if mplug is None:
+            mplug = self._mplug
         return mplug.getExistingArrayAttributeIndices()
 
-    @recycle_mplug
-    def is_free_to_change(self, mplug:om.MPlug):
-        ftc = mplug.isFreeToChange()
-        if ftc == om.MPlug.kFreeToChange:
-            return 1
-        elif ftc == om.MPlug.kNotFreeToChange:
-            return 0
-        else:  # ftc == om2.MPlug.kChildrenNotFreeToChange
-            return -1
-
-    @recycle_mplug
-    def is_dynamic(self, mplug: om.MPlug) -> bool:
+    def is_free_to_change(self, mplug:om.MPlug=None):
+        if mplug is None:
+            mplug = self._mplug
+        return _free_to_change_states.get(mplug.isFreeToChange(), -1)
+
+    def is_dynamic(self, mplug: om.MPlug=None) -> bool:
+        if mplug is None:
+            mplug = self._mplug
         return mplug.isDynamic
 
-    @recycle_mfn
     def is_multi(self, mfn: om.MFnAttribute=None) -> bool:
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.array
 
-    @recycle_mplug
-    def is_keyable(self, mplug:om.MPlug) -> bool:
+    def _set_plug_flag(self, flag:str, set_method:Callable, value:bool, mplug:Optional[om.MPlug]):
+        """
+        Undoable version of the set_*_ methods toggling a flag of the plug (keyable, displayable, locked...)
+
+        Args:
+            flag (str): the name of the MPlug property holding the current value of the flag
+            set_method (Callable): the non-undoable method setting the flag
+            value (bool): the new value of the flag
+            mplug (MPlug, optional): the plug to edit, the plug of this attribute is used if None
+
+        Returns:
+            None
+        """
+        if mplug is None:
+            mplug = self._mplug
+        old_value = getattr(mplug, flag)
+        modifier = ProxyModifier(do_func=lambda: set_method(value, mplug),
+                                 undo_func=lambda: set_method(old_value, mplug))
+        modifier.doIt()
+        undoqueue.commit(undo=modifier.undoIt, redo=modifier.doIt)
+
+    def is_keyable(self, mplug:om.MPlug=None) -> bool:
+        if mplug is None:
+            mplug = self._mplug
         return mplug.isKeyable
 
-    @recycle_mplug
-    def set_keyable_(self, value, mplug:om.MPlug):
+    def set_keyable_(self, value, mplug:om.MPlug=None):
+        if mplug is None:
+            mplug = self._mplug
         mplug.isKeyable = value
         if not value:
             mplug.isChannelBox = True
         else:
             mplug.isChannelBox = False
 
-    @recycle_mplug
-    def set_keyable(self, value, mplug:om.MPlug):
-        old_value = self.is_keyable(mplug=mplug)
-        modifier = ProxyModifier(do_func=self.set_keyable_,
-                                 do_kwargs={'value':value, 'mplug':mplug},
-                                 undo_kwargs={'value':old_value, 'mplug':mplug})
-        modifier.doIt()
-        apiundo.commit(undo=modifier.undoIt, redo=modifier.doIt)
+    def set_keyable(self, value, mplug:om.MPlug=None):
+        self._set_plug_flag('isKeyable', self.set_keyable_, value, mplug)
 
-    @recycle_mplug
-    def is_displayable(self, mplug: om.MPlug) -> bool:
+    def is_displayable(self, mplug: om.MPlug=None) -> bool:
+        if mplug is None:
+            mplug = self._mplug
         return mplug.isChannelBox
 
-    @recycle_mplug
-    def set_displayable_(self, value, mplug: om.MPlug):
+    def set_displayable_(self, value, mplug: om.MPlug=None):
+        if mplug is None:
+            mplug = self._mplug
         mplug.isChannelBox = value
 
-    @recycle_mplug
-    def set_displayable(self, value, mplug: om.MPlug):
-        old_value = self.is_displayable(mplug=mplug)
-        modifier = ProxyModifier(do_func=self.set_displayable_,
-                                 do_kwargs={'value': value, 'mplug': mplug},
-                                 undo_kwargs={'value': old_value, 'mplug': mplug})
-        modifier.doIt()
-        apiundo.commit(undo=modifier.undoIt, redo=modifier.doIt)
+    def set_displayable(self, value, mplug: om.MPlug=None):
+        self._set_plug_flag('isChannelBox', self.set_displayable_, value, mplug)
 
-    @recycle_mplug
-    def is_locked(self, mplug: om.MPlug) -> bool:
+    def is_locked(self, mplug: om.MPlug=None) -> bool:
+        if mplug is None:
+            mplug = self._mplug
         return mplug.isLocked
 
-    @recycle_mplug
-    def set_locked_(self, value, mplug: om.MPlug):
+    def set_locked_(self, value, mplug: om.MPlug=None):
+        if mplug is None:
+            mplug = self._mplug
         mplug.isLocked = value
 
-    @recycle_mplug
-    def set_locked(self, value, mplug: om.MPlug):
-        old_value = self.is_locked(mplug=mplug)
-        modifier = ProxyModifier(do_func=self.set_locked_,
-                                 do_kwargs={'value': value, 'mplug': mplug},
-                                 undo_kwargs={'value': old_value, 'mplug': mplug})
+    def set_locked(self, value, mplug: om.MPlug=None):
+        self._set_plug_flag('isLocked', self.set_locked_, value, mplug)
+
+    def set_flags(self, keyable:bool=None, displayable:bool=None, locked:bool=None, mplug:om.MPlug=None):
+        """
+        Sets several flags of the plug at once, with a single entry in the undo queue. This is cheaper than calling
+        set_keyable, set_displayable and set_locked one after the other when configuring many channels.
+        The flags are applied in that order, so displayable wins over the channel box state set by keyable.
+
+        Args:
+            keyable (bool, optional): the new keyable state, left untouched if None
+            displayable (bool, optional): the new displayable (channel box) state, left untouched if None
+            locked (bool, optional): the new locked state, left untouched if None
+            mplug (MPlug, optional): the plug to edit, the plug of this attribute is used if None
+
+        Returns:
+            None
+        """
+        if mplug is None:
+            mplug = self._mplug
+        setters = [(setter, value) for setter, value in ((self.set_keyable_, keyable),
+                                                          (self.set_displayable_, displayable),
+                                                          (self.set_locked_, locked)) if value is not None]
+        if not setters:
+            return
+
+        # set_keyable_ also edits the channel box state, so the whole state is restored when undoing
+        old_state = (mplug.isKeyable, mplug.isChannelBox, mplug.isLocked)
+
+        def do_it():
+            for setter, value in setters:
+                setter(value, mplug)
+
+        def undo_it():
+            mplug.isKeyable, mplug.isChannelBox, mplug.isLocked = old_state
+
+        modifier = ProxyModifier(do_func=do_it, undo_func=undo_it)
         modifier.doIt()
-        apiundo.commit(undo=modifier.undoIt, redo=modifier.doIt)
+        undoqueue.commit(undo=modifier.undoIt, redo=modifier.doIt)
 
     # INPUTS AND OUTPUTS
-    @recycle_mplug
-    def is_source(self, mplug: om.MPlug):
+    def is_source(self, mplug: om.MPlug=None):
+        if mplug is None:
+            mplug = self._mplug
         return mplug.isSource
 
-    @recycle_mplug
-    def is_destination(self, mplug: om.MPlug):
+    def is_destination(self, mplug: om.MPlug=None):
+        if mplug is None:
+            mplug = self._mplug
         return mplug.isDestination
 
-    @recycle_mplug
     def source(self, skip_conversion:bool=True, as_api:bool=False, mplug:om.MPlug=None) -> TInputs:
-        if mplug.isArray:
-            result = []
-            indices = mplug.getExistingArrayAttributeIndices()
-            it = Iterator(indices)
-            while not it.is_done():
-                index = it.current_item()
-                plug = mplug.elementByLogicalIndex(index)
-                if plug.isDestination:
-                    if skip_conversion:
-                        src = plug.source()
-                    else:
-                        src = plug.sourceWithConversion()
-
-                    if as_api:
-                        result.append(src)
-                    else:
-                        result.append(self._factory(src))
-                it.next()
-            return result
+        if mplug is None:
+            mplug = self._mplug
+            # Whether a plug is an array never changes, so it is only queried once for this attribute's plug
+            is_array = self._is_array
+            if is_array is None:
+                is_array = self._is_array = mplug.isArray
+        else:
+            is_array = mplug.isArray
+
+        get_source = om.MPlug.source if skip_conversion else om.MPlug.sourceWithConversion
+        if is_array:
+            # Only the connected elements are visited, they still need to be filtered as they may only be sources
+            connection_by_index = mplug.connectionByPhysicalIndex
+            plugs = [connection_by_index(i) for i in range(mplug.numConnectedElements())]
+            result = [get_source(plug) for plug in plugs if plug.isDestination]
+
+            if as_api:
+                return result
+            return self._connected_attributes(result, mplug.node())
         else:
             if not mplug.isDestination:
                 return None
-            if skip_conversion:
-                src = mplug.source()
-            else:
-                src = mplug.sourceWithConversion()
+            src = get_source(mplug)
 
             if as_api:
                 return src
             else:
-                return self._factory(src)
+                return self._connected_attributes((src,), mplug.node())[0]
 
-    @recycle_mplug
     def destinations(self, skip_conversion:bool=True, as_api:bool=False, mplug:om.MPlug=None) -> TOutputs:
+        if mplug is None:
+            mplug = self._mplug
+            # Whether a plug is an array never changes, so it is only queried once for this attribute's plug
+            is_array = self._is_array
+            if is_array is None:
+                is_array = self._is_array = mplug.isArray
+        else:
+            is_array = mplug.isArray
+
+        get_destinations = om.MPlug.destinations if skip_conversion else om.MPlug.destinationsWithConversion
+        if is_array:
+            # Only the connected elements are visited, they still need to be filtered as they may only be destinations
+            connection_by_index = mplug.connectionByPhysicalIndex
+            plugs = [connection_by_index(i) for i in range(mplug.numConnectedElements())]
+            result = [get_destinations(p) for p in plugs if p.isSource]
 
-        def plug_array_to_attribute(array) -> List:
-            plug_list = []
-            array_it = Iterator(array)
-            while not array_it.is_done():
-                p = array_it.current_item()
-                plug_list.append(self._factory(p))
-                array_it.next()
-            return plug_list
-
-        if mplug.isArray:
-            result = []
-            indices = mplug.getExistingArrayAttributeIndices()
-            it = Iterator(indices)
-
-            while not it.is_done():
-                idx = it.current_item()
-                p = mplug.elementByLogicalIndex(idx)
-                if p.isSource:
-                    if skip_conversion:
-                        plug_array = p.destinations()
-                    else:
-                        plug_array = p.destinationsWithConversion()
-
-                    if as_api:
-                        result.append(plug_array)
-                    else:
-                        result.append(plug_array_to_attribute(plug_array))
-
-                it.next()
-            return result
+            if as_api:
+                return result
+            # The node is fetched once for all the elements
+            node_mobject = mplug.node()
+            connected_attributes = self._connected_attributes
+            return [connected_attributes(plug_array, node_mobject) for plug_array in result]
         else:
             if not mplug.isSource:
                 return None
-
-            if skip_conversion:
-                plug_array = mplug.destinations()
-            else:
-                plug_array = mplug.destinationsWithConversions()
+            plug_array = get_destinations(mplug)
 
             if as_api:
                 return plug_array
             else:
-                return plug_array_to_attribute(plug_array)
+                return self._connected_attributes(plug_array, mplug.node())
 
     def get(self, as_string:bool=False, time:TTime=None, context:om.MDGContext=None) -> Any:
         """
@@ -407,20 +502,58 @@ class Attribute(MayaObject):
             - If `time` is provided but not as an `MTime` object, it is converted to one using the current time unit.
             - The value is retrieved using the `get_plug_value` method, which handles the attribute's data type and context.
         """
-        if context is not None:
-            eval_ctx = context
-        elif time is not None:
-            if isinstance(time, om.MTime):
-                eval_ctx = om.MDGContext(time)
-            else:
-                eval_ctx = om.MDGContext(om.MTime(time, unit=om.MTime.uiUnit()))
-        else:
-            eval_ctx = om.MDGContext.kNormal
+        if context is None:
+            if time is None:
+                # Most common case, checked first
+                return get_plug_value(self._mplug, None, as_string, _eval_context)
+            context = _time_to_context(time)
+
+        return get_plug_value(self._mplug, None, as_string, context)
 
-        value = get_plug_value(plug=self.api_mplug(), as_string=as_string, context=eval_ctx)
-        return value
+    @classmethod
+    def get_many(cls, attributes:Iterable[Attribute], as_string:bool=False, time:TTime=None,
+                 context:om.MDGContext=None) -> List[Any]:
+        """
+        Retrieves the values of several attributes in the same evaluation context, which is only built once.
+
+        Args:
+            attributes (Iterable[Attribute]): the attributes to get the values of
+            as_string (bool, optional): If True, enum values are returned as strings. Defaults to False.
+            time (float, int, MTime, optional): The time at which to evaluate the attributes. Defaults to None.
+            context (MDGContext, optional): The evaluation context to use. Takes precedence over `time`.
+
+        Returns:
+            List[Any]: the values of the attributes, in the same order
+        """
+        if context is None:
+            context = _eval_context if time is None else _time_to_context(time)
+        return [attr.get(as_string=as_string, context=context) for attr in attributes]
+
+    @staticmethod
+    @contextmanager
+    def eval_at(time:TTime=None, context:om.MDGContext=None):
+        """
+        Context manager changing the evaluation context used by `get` when it is called without a time or a context.
+        The context is built once, which avoids creating one per attribute when sampling many of them at the same time.
+
+        Args:
+            time (float, int, MTime, optional): The time at which to evaluate the attributes.
+            context (MDGContext, optional): The evaluation context to use. Takes precedence over `time`.
+
+        Examples:
+            with Attribute.eval_at(10):
+                values = [attr.get() for attr in attributes]
+        """
+        global _eval_context
+        previous = _eval_context
+        if context is None:
+            context = _normal_context if time is None else _time_to_context(time)
+        _eval_context = context
+        try:
+            yield
+        finally:
+            _eval_context = previous
 
-    @recycle_mplug
     def set_(self, value:Any, data_type:DataType=None, mplug:om.MPlug=None):
         """
         Sets the value of the attribute using the specified MPlug.
@@ -439,10 +572,10 @@ class Attribute(MayaObject):
             - This method uses `set_plug_value` for setting the plug value.
             - No undo functionality or modifiers are applied.
         """
+        if mplug is None:
+            mplug = self._mplug
         set_plug_value(plug=mplug, value=value, data_type=data_type)
 
-    @recycle_mplug
-    @add_modifier(DGModifier, undo=True)
     def set(self, value:Any, data_type:DataType=None, mplug:om.MPlug=None, _modifier:Union[DGModifier, DagModifier]=None):
         """
         Sets the value of the attribute with undo and modifier management.
@@ -462,13 +595,16 @@ class Attribute(MayaObject):
 
         Notes:
             - This method uses `_modifier.set_plug_value` to perform the operation.
-            - The `add_modifier` decorator ensures undo/redo functionality is managed seamlessly.
-            - The `recycle_mplug` decorator ensures the `mplug` argument is initialized if not provided.
+            - When no modifier is provided, the one created is executed and registered in the undo queue.
         """
-        _modifier.set_plug_value(plug=mplug, value=value, data_type=data_type)
+        if mplug is None:
+            mplug = self._mplug
+        modifier = DGModifier() if _modifier is None else _modifier
+        modifier.set_plug_value(plug=mplug, value=value, data_type=data_type)
+
+        if _modifier is None:
+            _commit_modifier(modifier)
 
-    @recycle_mplug
-    @add_modifier(DGModifier, undo=True)
     def connect(self, destination:TConnect, force:bool=False, next_available:bool=False,
                 mplug:om.MPlug=None, _modifier:DGModifier=None):
         """
@@ -496,23 +632,28 @@ class Attribute(MayaObject):
         Returns:
             None
         """
-
+        if mplug is None:
+            mplug = self._mplug
         if mplug.isArray and mplug.attribute().hasFn(om.MFn.kTypedAttribute) and not mplug.isDynamic:
             mplug = mplug.elementByLogicalIndex(0)
 
-        _modifier.connect_(s_plug=mplug, d_plug=_as_mplug(destination), force=force, next_available=next_available)
+        modifier = DGModifier() if _modifier is None else _modifier
+        modifier.connect_(s_plug=mplug, d_plug=_as_mplug(destination), force=force, next_available=next_available)
+
+        if _modifier is None:
+            _commit_modifier(modifier)
 
-    @recycle_mplug
-    @add_modifier(DGModifier, undo=True)
     def disconnect(self, *args:TConnect, mplug:om.MPlug=None, _modifier:DGModifier=None):
         """
         Disconnects one or more attributes from this attribute.
 
-        The source objects are first converted to MPlugs using the helper function `_as_mplug`.
+        The destination objects are first converted to MPlugs using the helper function `_as_mplug`. When any is
+        given, this attribute is always treated as the source of the connections to remove.
 
         Args:
-            *args (TConnect): A variable number of source attributes to disconnect. Each source can be given as an
-                Attribute, a string identifier, or an MPlug.
+            *args (TConnect): A variable number of destination attributes to disconnect. Each one can be given as
+                an Attribute, a string identifier, or an MPlug. If none is given, this attribute is disconnected from
+                its source.
             mplug (MPlug, optional): The optional MPlug representing this attribute. If not provided, it will be fetched
                 automatically using the api_mplug method
             _modifier (DGModifier, optional): The modifier used to queue and execute the connection. defaults to a
@@ -521,13 +662,19 @@ class Attribute(MayaObject):
         Returns:
             None
         """
+        if mplug is None:
+            mplug = self._mplug
+        modifier = DGModifier() if _modifier is None else _modifier
+        if args:
+            modifier.disconnect_(mplug, *map(_as_mplug, args))
+        else:
+            # Nothing given, disconnect this attribute from its source
+            modifier.disconnect_(mplug)
 
-        plugs = [_as_mplug(obj) for obj in args]
-        plugs.insert(0, mplug)
-        _modifier.disconnect_(*args)
+        if _modifier is None:
+            _commit_modifier(modifier)
 
 class QuantifiableAttribute(Attribute):
-    @recycle_mfn
     def has_min(self, mfn:TQuantifiableFn=None):
         """
         Check if this attribute has a minimum value defined.
@@ -538,9 +685,9 @@ class QuantifiableAttribute(Attribute):
         Returns:
             bool: True if the attribute has a minimum value, False otherwise.
         """
-
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.hasMin()
-    @recycle_mfn
     def has_max(self, mfn: TQuantifiableFn=None):
         """
         Check if this attribute has a maximum value defined.
@@ -551,9 +698,10 @@ class QuantifiableAttribute(Attribute):
         Returns:
             bool: True if the attribute has a maximum value, False otherwise.
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.hasMax()
 
-    @recycle_mfn
     def get_min(self, mfn: TQuantifiableFn=None):
         """
         Retrieve the minimum value of this attribute.
@@ -564,9 +712,10 @@ class QuantifiableAttribute(Attribute):
         Returns:
             TDefaultValues: The current minimum value of the attribute.
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.getMin()
 
-    @recycle_mfn
     def get_max(self, mfn: TQuantifiableFn=None):
         """
         Retrieve the maximum value of this attribute.
@@ -577,10 +726,10 @@ class QuantifiableAttribute(Attribute):
         Returns:
             TDefaultValues: The current maximum value of the attribute.
         """
-
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.getMax()
 
-    @recycle_mfn
     def has_soft_min(self, mfn: TQuantifiableFn=None):
         """
         Check if this attribute has a minimum value defined.
@@ -591,10 +740,10 @@ class QuantifiableAttribute(Attribute):
         Returns:
             bool: True if the attribute has a minimum value, False otherwise.
         """
-
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.hasSoftMin()
 
-    @recycle_mfn
     def has_soft_max(self, mfn: TQuantifiableFn=None):
         """
         Check if this attribute has a maximum value defined.
@@ -605,9 +754,10 @@ class QuantifiableAttribute(Attribute):
         Returns:
             bool: True if the attribute has a maximum value, False otherwise.
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.hasSoftMax()
 
-    @recycle_mfn
     def get_soft_min(self, mfn: TQuantifiableFn=None):
         """
         Retrieve the minimum value of this attribute.
@@ -618,9 +768,10 @@ class QuantifiableAttribute(Attribute):
         Returns:
             TDefaultValues: The current minimum value of the attribute.
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.getSoftMin()
 
-    @recycle_mfn
     def get_soft_max(self, mfn: TQuantifiableFn=None):
         """
         Retrieve the maximum value of this attribute.
@@ -631,10 +782,10 @@ class QuantifiableAttribute(Attribute):
         Returns:
             TDefaultValues: The current maximum value of the attribute.
         """
-
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.getSoftMax()
 
-    @recycle_mfn
     def set_min_(self, value:TDefaultValues, mfn: TQuantifiableFn=None):
         """
         NOT UNDOABLE
@@ -646,9 +797,10 @@ class QuantifiableAttribute(Attribute):
         Returns:
             None
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         mfn.setMin(value)
 
-    @recycle_mfn
     def set_max_(self, value: TDefaultValues, mfn: TQuantifiableFn=None):
         """
         NOT UNDOABLE
@@ -660,9 +812,10 @@ class QuantifiableAttribute(Attribute):
         Returns:
             None
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         mfn.setMax(value)
 
-    @recycle_mfn
     def set_soft_min_(self, value: TDefaultValues, mfn: TQuantifiableFn=None):
         """
         NOT UNDOABLE
@@ -674,9 +827,10 @@ class QuantifiableAttribute(Attribute):
         Returns:
             None
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         mfn.setSoftMin(value)
 
-    @recycle_mfn
     def set_soft_max_(self, value: TDefaultValues, mfn: TQuantifiableFn=None):
         """
         NOT UNDOABLE
@@ -688,9 +842,10 @@ class QuantifiableAttribute(Attribute):
         Returns:
             None
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         mfn.setSoftMax(value)
 
-    @recycle_mfn
     @undoable_proxy_wrap(get_min, set_min_)
     def set_min(self, value:TDefaultValues, mfn: TQuantifiableFn=None):
         """
@@ -705,7 +860,6 @@ class QuantifiableAttribute(Attribute):
         """
         ...
 
-    @recycle_mfn
     @undoable_proxy_wrap(get_max, set_max_)
     def set_max(self, value:TDefaultValues, mfn: TQuantifiableFn=None):
         """
@@ -720,7 +874,6 @@ class QuantifiableAttribute(Attribute):
         """
         ...
 
-    @recycle_mfn
     @undoable_proxy_wrap(get_soft_min, set_soft_min_)
     def set_soft_min(self, value: TDefaultValues, mfn: TQuantifiableFn=None):
         """
@@ -735,7 +888,6 @@ class QuantifiableAttribute(Attribute):
         """
         ...
 
-    @recycle_mfn
     @undoable_proxy_wrap(get_soft_max, set_soft_max_)
     def set_soft_max(self, value: TDefaultValues, mfn: TQuantifiableFn=None):
         """
@@ -777,18 +929,19 @@ class MultiAttribute(Attribute):
         handle = om.MObjectHandle(plug.attribute())
         return self._factory(MPlug=plug, MObjectHandle=handle, node=self.node())
 
-    @recycle_mplug
     def indices(self, mplug:om.MPlug=None) -> Union[om.MIntArray, Iterable]:
+        if mplug is None:
+            mplug = self._mplug
         return mplug.getExistingArrayAttributeIndices()
 
     def get(self, as_string:bool=False, time:TTime=None, context:om.MDGContext=None) -> List[Any]:
-        result = []
-        iterator = Iterator(self.indices())
-        while not iterator.is_done():
-            idx = iterator.current_item()
-            result.append(self[idx].get(as_string=as_string, time=time, context=context))
-            iterator.next()
+        # Build the context once for all the elements
+        if context is None and time is not None:
+            context = _time_to_context(time)
 
+        result = []
+        for idx in self.indices():
+            result.append(self[idx].get(as_string=as_string, context=context))
         return result
 
     def set_(self, value:Iterable, data_type:DataType=None, mplug:om.MPlug=None):
@@ -800,6 +953,8 @@ class MultiAttribute(Attribute):
             self._get_item(idx).set(value=v, data_type=data_type, mplug=mplug,
                                     _modifier=_modifier)
 
+_quantifiable_attr_types = frozenset((AttrType.UNIT, AttrType.NUMERIC))
+
 @dataclass
 class AttrData:
     """
@@ -810,13 +965,13 @@ class AttrData:
         short_name (str): The short name for the attribute.
         attr_type (AttrType): The type of attribute.
         data_type (Optional[DataType]): The data type of the attribute's value, if applicable.
-        default_value (Optional[int, float, Iterable[int, float]]): The default value for the attribute.
+        default_value (Optional[TDefaultValues]): The default value for the attribute.
         keyable (bool): Indicates whether the attribute is keyable for animation. Defaults to False.
         readable (bool): Indicates whether the attribute is readable. Defaults to True.
-        min (Optional[int, float, Iterable[int, float]]): The minimum allowed value for the attribute.
-        max (Optional[int, float, Iterable[int, float]]): The maximum allowed value for the attribute.
-        soft_min (Optional[int, float, Iterable[int, float]]): The soft minimum value hint for the attribute.
-        soft_max (Optional[int, float, Iterable[int, float]]): The soft maximum value hint for the attribute.
+        min (Optional[TDefaultValues]): The minimum allowed value for the attribute.
+        max (Optional[TDefaultValues]): The maximum allowed value for the attribute.
+        soft_min (Optional[TDefaultValues]): The soft minimum value hint for the attribute.
+        soft_max (Optional[TDefaultValues]): The soft maximum value hint for the attribute.
         multi (Optional[bool]): Specifies if the attribute is multi. False by default.
         index_matters (Optional[bool]): For multi-attributes, determines if indexing is significant. Defaults to False.
         enum_names (Optional[str]): A string with names if the attribute is an enum.
@@ -846,49 +1001,49 @@ class AttrData:
     parent:Union["AttrData", str, None]=None
 
     # Internal
-    create_args: field(init=False, default_factory=list) = None
+    create_args: Tuple[Any, ...] = field(init=False, default=())
 
 
     def __post_init__(self):
         self._process_data()
 
     def _process_data(self):
-        self.create_args = []
         # If no short name was provided, make it default to the long name
         if self.short_name is None:
             self.short_name = self.long_name
 
-        self.create_args.extend((self.long_name, self.short_name))
-
         # if no AttrType was provided, guess it from the DataType (applicable for UNIT and NUMERIC attribute types)
         if self.attr_type is None:
             self.attr_type = AttrType.from_data_type(self.data_type)
-            if self.attr_type == AttrType.INVALID:
+            if self.attr_type is AttrType.INVALID:
                 raise TypeError('Invalid attribute type')
+        attr_type = self.attr_type
 
+        # The arguments of the create function of the function set are built in one go, depending on the AttrType
         # in the case of a UNIT or NUMERIC attribute, make sure we have a default value
-        if self.attr_type in (AttrType.UNIT, AttrType.NUMERIC) and self.data_type not in (
-        DataType.COLOR, DataType.FLOAT3):
+        if attr_type in _quantifiable_attr_types and self.data_type not in (DataType.COLOR, DataType.FLOAT3):
             if self.default_value is None:
                 self.default_value = 0.0
 
-            self.create_args.append(DataType.to_api_type(self.data_type))
-            self.create_args.append(self.default_value)
+            self.create_args = (self.long_name, self.short_name, DataType.to_api_type(self.data_type),
+                                self.default_value)
 
         # Default values for STRING attribute must be an MObject, so we create one using MFnStringData
-        if self.attr_type == AttrType.STRING:
+        elif attr_type is AttrType.STRING:
             if self.default_value is None:
                 self.default_value = om.MObject.kNullObj
             else:
                 string_data = om.MFnStringData()
                 self.default_value = string_data.create(self.default_value)
 
-            self.create_args.append(om.MFnData.kString)
-            self.create_args.append(self.default_value)
+            self.create_args = (self.long_name, self.short_name, om.MFnData.kString, self.default_value)
+
+        else:
+            self.create_args = (self.long_name, self.short_name)
 
         # If the AttrType is ENUM, we need to process the enum_names into enum_fields.
         # Then, if no default value was provided, use the smallest int in the fields
-        if self.attr_type == AttrType.ENUM:
+        if self.attr_type is AttrType.ENUM:
             if self.enum_names is not None:
                 self.enum_fields = AttrData.enum_str_to_field(self.enum_names)
             else:
@@ -898,7 +1053,7 @@ class AttrData:
             if self.default_value is None:
                 self.default_value = min(self.enum_fields, key=lambda x: x[1])[1]
 
-        if self.attr_type == AttrType.COMPOUND:
+        if self.attr_type is AttrType.COMPOUND:
             if not self.children_count:
                 raise ValueError(f'Compound attributes require a children count > 0')
 
@@ -939,13 +1094,15 @@ class AttributeHandler:
             node (MObject): an MObject representing the node to which the attributes will be added
         """
         self.compound_buffer = {}
-        self.added_compound = []
+        # Index of the pending compounds by name, kept in sync with compound_buffer
+        self._compound_by_name: Dict[str, om.MFnCompoundAttribute] = {}
+        self.added_compound = set()
+        # Function sets of the compounds already on the node that received children during this pass, by name
+        self._parent_fn_cache: Dict[str, om.MFnCompoundAttribute] = {}
         self.node_fn = om.MFnDependencyNode(node)
         self.node_mobj = node
 
-        self._setup_decorator()
-
-    # @add_modifier Dynamically added with _setup_decorator
+    @add_modifier(DGModifier, undo=True, post_call='purge')
     def add_attribute(self, fn:om.MFnAttribute, children_count:int=None, parent:str=None, _modifier:DGModifier=None):
         """
         Adds an attribute to a specific node, managing the complexities of compound attributes
@@ -966,8 +1123,8 @@ class AttributeHandler:
                 Otherwise, executing the doIt function is the user's responsibility, alongside with the purge function
 
         Notes:
-            - This method is dynamically decorated by `add_modifier` in order to provide a default modifier if none was
-              given, and execute the doIt function afterward.
+            - This method is decorated by `add_modifier` in order to provide a default modifier if none was
+              given, and execute the doIt and purge functions afterward.
             - When compound attributes are added, they are initially stored in a buffer to ensure they
               include the specified number of children.
 
@@ -981,10 +1138,13 @@ class AttributeHandler:
             else:
                 self._do_add(fn, _modifier)
         else:
-            if self.node_fn.hasAttribute(parent):
+            parent_fn = self._parent_fn_cache.get(parent)
+            if parent_fn is None and self.node_fn.hasAttribute(parent):
+                plug = self.node_fn.findPlug(parent, False)
+                parent_fn = self._parent_fn_cache[parent] = om.MFnCompoundAttribute(plug.attribute())
+
+            if parent_fn is not None:
                 self._do_add(fn, _modifier)
-                plug = self.node_fn.findPlug(parent)
-                parent_fn = om.MFnCompoundAttribute(plug.attribute())
                 parent_fn.addChild(fn.object())
             else:
                 parent_fn = self._find_pending_compound(parent)
@@ -1004,10 +1164,9 @@ class AttributeHandler:
             ValueError : no attribute with the given name was found
 
         """
-        for fn in self.compound_buffer:
-            if fn.name == name:
-                return fn
-        else:
+        try:
+            return self._compound_by_name[name]
+        except KeyError:
             raise ValueError(f'Could not find an pending compound attribute named {name}')
 
     def _buffer_compound(self, fn:om.MFnCompoundAttribute, children_count:int):
@@ -1018,6 +1177,7 @@ class AttributeHandler:
             children_count (int): the amount of children the attribute should have to be added to the node
         """
         self.compound_buffer[fn] = children_count
+        self._compound_by_name[fn.name] = fn
 
     def _is_ready(self, fn:om.MFnCompoundAttribute) -> bool:
         """
@@ -1030,13 +1190,7 @@ class AttributeHandler:
             bool: True if it has enough children, False otherwise
 
         """
-        count = self.compound_buffer[fn]
-        if fn in self.added_compound:
-            return False
-        elif fn.numChildren() >= count:
-            return True
-        else:
-            return False
+        return fn not in self.added_compound and fn.numChildren() >= self.compound_buffer[fn]
 
     def _eval_compound_buffer(self, fn:Union[om.MFnCompoundAttribute, None]=None, _modifier:DGModifier=None):
         """
@@ -1046,12 +1200,13 @@ class AttributeHandler:
             fn (MFnCompoundAttribute, None): the attribute to check. Checks the whole buffer if the value is None
             _modifier (DGModifier): the modifier used to add the attribute to the node
         """
-        if fn is None:
-            checklist = self.compound_buffer.keys()
-        else:
-            checklist = [fn]
+        # add_attribute passes the compound that just received a child, so that only this one is checked
+        if fn is not None:
+            if self._is_ready(fn):
+                self._do_add(fn, _modifier)
+            return
 
-        for fn in checklist:
+        for fn in list(self.compound_buffer):
             if self._is_ready(fn):
                 self._do_add(fn, _modifier)
 
@@ -1065,7 +1220,7 @@ class AttributeHandler:
         """
         _modifier.addAttribute(self.node_mobj, fn.object())
         if fn in self.compound_buffer:
-            self.added_compound.append(fn)
+            self.added_compound.add(fn)
 
     def purge(self):
         """
@@ -1075,14 +1230,9 @@ class AttributeHandler:
         # Meant to be called with the doIt function
         for k in self.added_compound:
             self.compound_buffer.pop(k)
-        self.added_compound = []
-
-    def _setup_decorator(self):
-        """
-        Dynamic decoration of add_attribute with the add_modifier decorator in order to call purge alongside with the
-        doIt call of the modifier
-        """
-        self.add_attribute = add_modifier(DGModifier, undo=True, post_call=self.purge)(self.add_attribute)
+            self._compound_by_name.pop(k.name, None)
+        self.added_compound.clear()
+        self._parent_fn_cache.clear()
 
 class AttrContext:
     def __init__(self, handler:AttributeHandler, modifier:DGModifier, undo:bool=True):
@@ -1105,7 +1255,7 @@ class AttrContext:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.modifier.doIt()
         if self.undo:
-            apiundo.commit(undo=self.modifier.undoIt, redo=self.modifier.doIt)
+            undoqueue.commit(undo=self.modifier.undoIt, redo=self.modifier.doIt)
         self.handler.purge()
 
 #ToDo: move the utility stuff in a utilities module
\ No newline at end of file
@@ -1,7 +1,6 @@
 from typing import Union
 from maya.api import OpenMaya as om
 from omwrapper.entities.attributes.base import Attribute
-from omwrapper.entities.base import recycle_mfn
 
 TAttrInput = Union[Attribute, om.MObject]
 
@@ -14,7 +13,6 @@ class CompoundAttribute(Attribute):
     _mfn_class = om.MFnCompoundAttribute
     _mfn_constant = om.MFn.kCompoundAttribute
 
-    @recycle_mfn
     def child(self, x: int, as_mplug: bool = False, mfn: om.MFnCompoundAttribute = None):
         """
         Retrieve a child attribute by its index.
@@ -30,17 +28,18 @@ class CompoundAttribute(Attribute):
         Raises:
             ValueError: If the index is out of range.
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         if x >= self.children_count(mfn=mfn):
             raise ValueError('Index out of range')
 
-        obj = mfn.child(x)
-        mplug = om.MPlug(obj)
+        # The child plug is taken from this attribute's plug, so that it belongs to the same node and array element
+        mplug = self.api_mplug().child(x)
         if as_mplug:
             return mplug
 
-        return self._factory(MPlug=mplug, MObjectHandle=om.MObjectHandle(obj))
+        return self._factory(MPlug=mplug, MObjectHandle=om.MObjectHandle(mplug.attribute()), node=self.node())
 
-    @recycle_mfn
     def add_child(self, attr: TAttrInput, mfn: om.MFnCompoundAttribute = None):
         """
         Add a child attribute to the compound attribute.
@@ -52,12 +51,13 @@ class CompoundAttribute(Attribute):
         Returns:
             None
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         if isinstance(attr, Attribute):
             attr = attr.api_mobject()
 
         mfn.addChild(attr)
 
-    @recycle_mfn
     def remove_child(self, attr: TAttrInput, mfn: om.MFnCompoundAttribute = None):
         """
         Remove a child attribute from the compound attribute.
@@ -69,12 +69,13 @@ class CompoundAttribute(Attribute):
         Returns:
             None
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         if isinstance(attr, Attribute):
             attr = attr.api_mobject()
 
         mfn.removeChild(attr)
 
-    @recycle_mfn
     def children_count(self, mfn: om.MFnCompoundAttribute = None):
         """
         Get the number of child attributes in the compound attribute.
@@ -85,4 +86,6 @@ class CompoundAttribute(Attribute):
         Returns:
             int: The number of child attributes.
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.numChildren()
\ No newline at end of file
@@ -6,11 +6,10 @@ from typing import Union, Dict, Callable, Any
 from maya.api import OpenMaya as om
 import maya.OpenMaya as om1
 
-from omwrapper.api import apiundo
+from omwrapper.api import undoqueue
 from omwrapper.api.modifiers.custom import ProxyModifier
 from omwrapper.api.utilities import unique_object_exists
-from omwrapper.entities.factory import PyObject
-from omwrapper.pytools import get_by_index
+from omwrapper.entities.factory import pyobject
 
 TMayaObjectApi = Union[om.MObject, om.MObjectHandle, om.MPlug, om.MDagPath]
 
@@ -18,9 +17,12 @@ class MayaObject(ABC):
     """
     Abstract base class responsible for representing any object in maya, nodes, attributes...
     """
+    # __dict__ is kept so that subclasses and user classes can still set any attribute, but it is only allocated the
+    #  first time one is set, so instances that only use slots don't pay for it
+    __slots__ = ('_api_input', '__dict__', '__weakref__')
     _mfn_class = om.MFnBase
     _mfn_constant = om.MFn.kInvalid
-    _factory = PyObject()
+    _factory = pyobject
 
     @abstractmethod
     def __init__(self, **kwargs: TMayaObjectApi):
@@ -121,22 +123,6 @@ class MayaObject(ABC):
         ...
 
 
-def recycle_mfn(func:Callable):
-    @wraps(func)
-    def wrapped(*args, **kwargs):
-        signature = inspect.signature(func)
-        bound_args = signature.bind(*args, **kwargs)
-        bound_args.apply_defaults()
-        bound_kwargs = bound_args.arguments
-
-        inst = bound_kwargs['self']
-        mfn = bound_kwargs.get('mfn', None)
-        if mfn is None:
-            bound_kwargs['mfn'] = inst.api_mfn()
-        result = func(**bound_kwargs)
-        return result
-    return wrapped
-
 #ToDo: not sure this is the right place for this v
 def undoable_proxy_wrap(get_method:Callable, set_method:Callable, undo_kwargs_override:dict=None):
     """
@@ -144,10 +130,10 @@ def undoable_proxy_wrap(get_method:Callable, set_method:Callable, undo_kwargs_ov
     used for actions that can't be easily made undoable with a classic modifier. The decorator requires a pair of get
     and set methods.
     The process is as follows:
-        - get the Signature of the set_method and fill it with the provided args & kwargs
-        - get the Signature of the get_method and fill it with the matching kwargs from the previous step
+        - fill the parameters of set_method with the provided args & kwargs
+        - fill the parameters of get_method with the matching kwargs from the previous step
         - get the current value with the get_method
-        - copy the OrderedDict from step 1 and update the second param(which is assumed to be the value to set, as the
+        - copy the dict from step 1 and update the second param(which is assumed to be the value to set, as the
           first param should be the instance (self))
         - create the ProxyModifier, execute it and register it for undoing
 
@@ -156,34 +142,46 @@ def undoable_proxy_wrap(get_method:Callable, set_method:Callable, undo_kwargs_ov
         set_method (Callable): the method used to set the new value, and set the old value when undoing
         undo_kwargs_override (dict, optional): optional dictionary of keyword args to pass to set_method when undoing
     """
+    # The binding plan of set_method is computed once, when decorating, so that each call only has to fill a dict:
+    #  the parameter names in order, their defaults, and the names shared with get_method
+    set_parameters = inspect.signature(set_method).parameters
+    set_names = tuple(set_parameters)
+    set_name_set = frozenset(set_names)
+    set_defaults = {name: p.default for name, p in set_parameters.items() if p.default is not p.empty}
+    get_parameters = inspect.signature(get_method).parameters
+    shared_names = tuple(name for name in set_names if name in get_parameters)
+    # the second parameter of set_method is assumed to be the value to set, as the first one should be the instance
+    value_name = set_names[1]
+    undo_override = undo_kwargs_override or {}
+
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Get the signature of set_method and fill it with the args and kwargs, then convert it to an OrderedDict
-            #  so that we have all the kwargs parameters filled
-
-            set_signature = inspect.signature(set_method)
-            do_bound_args = set_signature.bind(*args, **kwargs)
-            do_bound_args.apply_defaults()
-            do_kwargs = do_bound_args.arguments
-
-            # Get the signature of get_method and fill it with the matching kwargs from set_method, then get the current
-            #  value so that we can use it for undoing
-            get_parameters = inspect.signature(get_method).parameters.keys()
-            get_kwargs = {k:v for k, v in do_kwargs.items() if k in get_parameters}
-            old_value = get_method(**get_kwargs)
-
-            # get the second parameter of set_method, which is assumed to be the value to set.
-            #  note : The first parameter should be the instance (self)
-            k = get_by_index(do_kwargs, 1)
-            undo_kwargs = do_kwargs.copy()
-            if undo_kwargs_override is not None:
-                undo_kwargs.update(undo_kwargs_override)
-            undo_kwargs[k] = old_value
+            # Fill the parameters of set_method with the defaults, then the args and kwargs
+            # set_names and args both start with the instance, which is left out of the counts in the message
+            if len(args) > len(set_names):
+                raise TypeError(f'{func.__name__} takes {len(set_names) - 1} positional arguments but '
+                                f'{len(args) - 1} were given')
+            if not kwargs.keys().isdisjoint(set_names[:len(args)]):
+                repeated = [name for name in set_names[:len(args)] if name in kwargs]
+                raise TypeError(f'{func.__name__} got multiple values for arguments {repeated}')
+            do_kwargs = dict(set_defaults)
+            do_kwargs.update(zip(set_names, args))
+            do_kwargs.update(kwargs)
+            if len(do_kwargs) != len(set_names) or not set_name_set.issuperset(kwargs):
+                unexpected = [name for name in do_kwargs if name not in set_name_set]
+                missing = [name for name in set_names if name not in do_kwargs]
+                raise TypeError(f'{func.__name__} got unexpected arguments {unexpected} or is missing {missing}')
+
+            # Fill get_method with the matching kwargs from set_method, then get the current value so that we can use
+            #  it for undoing
+            old_value = get_method(**{name: do_kwargs[name] for name in shared_names})
+
+            undo_kwargs = {**do_kwargs, **undo_override, value_name: old_value}
 
             # Create the ProxyModifier and execute it, then register it for undoing
             mod = ProxyModifier(do_func=set_method, do_kwargs=do_kwargs, undo_kwargs=undo_kwargs)
             mod.doIt()
-            apiundo.commit(undo=mod.undoIt, redo=mod.doIt)
+            undoqueue.commit(undo=mod.undoIt, redo=mod.doIt)
         return wrapper
     return decorator
\ No newline at end of file
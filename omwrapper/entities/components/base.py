@@ -10,8 +10,7 @@ from maya.api import OpenMaya as om
 from omwrapper.api.modifiers.base import add_modifier
 from omwrapper.api.modifiers.maya import DagModifier
 from omwrapper.constants import DataType
-from omwrapper.entities.base import MayaObject, TMayaObjectApi, recycle_mfn, undoable_proxy_wrap
-from omwrapper.pytools import Iterator
+from omwrapper.entities.base import MayaObject, TMayaObjectApi, undoable_proxy_wrap
 
 if TYPE_CHECKING:
     from omwrapper.entities.nodes.shapes.base import GeometryShape
@@ -33,6 +32,7 @@ def recycle_mit(func:Callable):
     return wrapped
 
 class Component(MayaObject):
+    __slots__ = ('_node',)
     _mfn_class = om.MFnComponent
     _mfn_constant = None
     _mit_class = om.MItGeometry
@@ -155,15 +155,14 @@ class ComponentPoint(Component):
         it = self.api_mit()
         if it.count() != len(points):
             raise ValueError('The points array length does not match the vertex count')
-        point_it = Iterator(points)
-        while not it.isDone():
+        # The lengths match, so the component iterator can simply be advanced alongside the points
+        for point in points:
             if relative:
-                p = it.position(sapce=space) + DataType.to_vector(point_it.current_item())
+                p = it.position(space=space) + DataType.to_vector(point)
             else:
-                p = DataType.to_point(point_it.current_item())
+                p = DataType.to_point(point)
             it.setPosition(p, space=space)
             it.next()
-            point_it.next()
         self._post_set_positions(points=points, space=space, relative=relative, mit=it)
 
     @undoable_proxy_wrap(get_positions, set_positions_, {'relative': False})
@@ -8,13 +8,17 @@ import inspect
 
 from maya.api import OpenMaya as om
 
-from omwrapper.api.utilities import name_to_api, prod_list
+from omwrapper.api.utilities import name_to_api, name_to_mobject, prod_list
 from omwrapper.constants import ObjectType, AttributeType, ComponentType, AttrType, DataType
 
 if TYPE_CHECKING:
     from enum import Enum
     from omwrapper.entities.attributes.base import AttrData
 
+# The keyword used by PyObject for each supported API type
+_api_arg_keys = {om.MDagPath: 'MDagPath', om.MObjectHandle: 'MObjectHandle', om.MObject: 'MObject', om.MPlug: 'MPlug'}
+_api_arg_keys_set = frozenset(_api_arg_keys.values())
+
 class PyObject:
     """
     Singleton Factory class responsible for creating the right subclass of MayaObject
@@ -27,9 +31,6 @@ class PyObject:
             cls._instance._registry = {}
         return cls._instance
 
-    def __call__(self, *args, **kwargs) -> Any:
-        return self._create(*args, **kwargs)
-
     def register(self, object_type:Enum, cls:Callable):
         self._registry[object_type] = cls
 
@@ -96,82 +97,90 @@ class PyObject:
         """
         assert len(args) <= 1, 'PyObject does not take more than 1 non-keyword parameter'
 
-        #ToDo : make a method somewhere that would convert args into kwargs so that we can use that to jump straight to
-        # case 4 and avoid the situation where we get a string, process it, pass it back into PyObject, process it again
-        # and pass it a third time into PyObject (although is it really that bad ? ask Copilot maybe ?)
-        if len(args) == 1:
-            # CASE 1 : a string was provided, and we are looking for a corresponding API object. We then call PyObject
-            # again with whatever we found
-            arg = args[0]
-            if isinstance(arg, str):
-                return self._create(name_to_api(arg), **kwargs)
-            else:
-                dic = {}
-                if isinstance(arg, tuple):
-                    # CASE 2 : a tuple was provided, and it contains an MDagPath and an MObject or MObjectHandle
-                    # we put them in a dict and pass it as kwargs back into PyObject
-                    assert len(arg) == 2, 'PyObjectFactory : Invalid tuple length'
-                    assert isinstance(arg[0], om.MDagPath) and isinstance(arg[1], (om.MObject, om.MObjectHandle)), \
-                        'PyObject : Invalid tuple composition'
-
-                    for obj in arg:
-                        dic[obj.__class__.__name__] = obj
-                else:
-                    # CASE 3 : one or more API object were provided, such as MPlug, MDagPath, MObject...
-                    # we identify them and pass them back as kwargs into PyObject
-                    assert isinstance(arg, (om.MDagPath, om.MObjectHandle, om.MObject, om.MPlug)), \
-                        f'PyObject : Invalid param type {type(arg)}'
-
-                    dic[arg.__class__.__name__] = arg
-                dic.update(kwargs)
-                return self._create(**dic)
+        if args:
+            # CASES 1 to 3 : a name, a tuple or an API object was provided. They are converted to keyword args in one
+            # go, and then treated like CASE 4
+            kwargs = self._arg_to_kwargs(args[0], kwargs)
+
+        # CASE 4 : keywords args for any of the supported Maya API objects were provided, and we are going to treat
+        # them in a specific order to get the right MayaObject out of it. Eventually, all the previous cases end up
+        # being treated here.
+        assert not _api_arg_keys_set.isdisjoint(kwargs), \
+            'PyObject keyword parameter needs at least one of : (MDagPath, MObject, MObjectHandle, MPlug)'
+
+        if 'MPlug' in kwargs:
+            # CASE 4A : an MPlug was provided. Let's get an MObject out of it
+            mobj = kwargs['MPlug'].attribute()
+        elif 'MObjectHandle' in kwargs:
+            # CASE 4B : an MObjectHandle was provided. Let's get an MObject out of it. This is the form used by the
+            # factory itself, so when it comes with an MDagPath there is nothing left to complete
+            mobj = kwargs['MObjectHandle'].object()
+            if 'MDagPath' not in kwargs and mobj.hasFn(om.MFn.kDagNode):
+                kwargs['MDagPath'] = om.MDagPath.getAPathTo(mobj)
         else:
-            # CASE 4 : keywords args for any of the supported Maya API objects were provided, and we are going to treat
-            # them in a specific order to get the right MayaObject out of it. Eventually, all the previous cases end up
-            # being treated here.
-            assert any(k in ('MDagPath', 'MObject', 'MObjectHandle', 'MPlug') for k in kwargs), \
-                'PyObject keyword parameter needs at least one of : (MDagPath, MObject, MObjectHandle, MPlug)'
-
-            if 'MPlug' in kwargs:
-                # CASE 4A : an MPlug was provided. Let's get an MObject out of it
-                mobj = kwargs['MPlug'].attribute()
-            elif 'MObjectHandle' in kwargs:
-                # CASE 4B : an MObjectHandle was provided. Let's get an MObject out of it
-                mobj = kwargs['MObjectHandle'].object()
-            else:
-                # CASE 4C : none of the above were provided, assume an MDagPath was
-                mobj = kwargs.pop('MObject', None)
-                if mobj is None:
-                    mobj = kwargs['MDagPath'].node()
-                # else:
-                #     raise ValueError(f'Not enough data to build a PyObject : {kwargs}')
+            # CASE 4C : none of the above were provided, assume an MDagPath was
+            mobj = kwargs.pop('MObject', None)
+            if mobj is None:
+                mobj = kwargs['MDagPath'].node()
 
+        if 'MObjectHandle' not in kwargs:
             # If the MObject is a DagNode but no DagNode was provided, get one
             if 'MDagPath' not in kwargs and mobj.hasFn(om.MFn.kDagNode):
                 kwargs['MDagPath'] = om.MDagPath.getAPathTo(mobj)
+            # No MObjectHandle was provided, make one
+            kwargs['MObjectHandle'] = om.MObjectHandle(mobj)
 
-            # If no MObjectHandle was provided, make one
-            if 'MObjectHandle' not in kwargs:
-                kwargs['MObjectHandle'] = om.MObjectHandle(mobj)
+        object_type = ObjectType.from_mobject(mobj)
+        if object_type is None:
+            raise TypeError(f'Unrecognized api type : {mobj.apiType}')
 
-            for mfn in ObjectType.iter_mfn():
-                if mobj.hasFn(mfn):
-                    object_type = ObjectType.from_mfn(mfn)
-                    break
-            else:
-                raise TypeError(f'Unrecognized api type : {mobj.apiType}')
+        selector = self._registry.get(object_type)
+        if selector is None:
+            raise NotImplementedError(f'{object_type} is not yet implemented')
+        _class = selector(**kwargs)
+
+        try:
+            _class = user_class_manager.get_user_class(_class, mobj)
+        except ValueError:
+            ...
+
+        return _class(**kwargs)
 
-            selector = self._registry.get(object_type)
-            if selector is None:
-                raise NotImplementedError(f'{object_type} is not yet implemented')
-            _class = selector(**kwargs)
+    # Calling the factory goes straight to _create, without an intermediate frame
+    __call__ = _create
 
-            try:
-                _class = user_class_manager.get_user_class(_class, mobj)
-            except ValueError:
-                ...
+    @staticmethod
+    def _arg_to_kwargs(arg:Union[str, tuple, om.MDagPath, om.MObjectHandle, om.MObject, om.MPlug],
+                       kwargs:dict) -> dict:
+        """
+        Converts the non-keyword argument of _create to the keyword args expected by its CASE 4
+
+        Args:
+            arg (str, tuple, MDagPath, MObjectHandle, MObject, MPlug): the argument to convert
+            kwargs (dict): the keyword args that were passed along with it. They take precedence over the converted arg
 
-            return _class(**kwargs)
+        Returns:
+            dict: the keyword args
+        """
+        if isinstance(arg, str):
+            # CASE 1 : a string was provided, we look for the corresponding API object and convert it below
+            arg = name_to_api(arg)
+
+        if isinstance(arg, tuple):
+            # CASE 2 : a tuple was provided, and it contains an MDagPath and an MObject or MObjectHandle
+            assert len(arg) == 2, 'PyObjectFactory : Invalid tuple length'
+            # The exact types are checked, like in CASE 3, as they are the keys of _api_arg_keys
+            assert type(arg[0]) is om.MDagPath and type(arg[1]) in (om.MObject, om.MObjectHandle), \
+                'PyObject : Invalid tuple composition'
+            dic = {'MDagPath': arg[0], _api_arg_keys[type(arg[1])]: arg[1]}
+        else:
+            # CASE 3 : an API object was provided, such as MPlug, MDagPath, MObject...
+            key = _api_arg_keys.get(type(arg))
+            assert key is not None, f'PyObject : Invalid param type {type(arg)}'
+            dic = {key: arg}
+
+        dic.update(kwargs)
+        return dic
 
     def from_selection_list(self, sel:om.MSelectionList):
         it = om.MItSelectionList(sel)
@@ -264,8 +273,7 @@ class ComponentAccessor:
         mfn = self._get_comp_class()(self.geometry.node())
         mfn.create(ComponentType.to_mfn(self.comp_type))
         mfn.addElements(elements)
-        factory = PyObject()
-        component = factory(MDagPath=self.geometry, MObjectHandle=om.MObjectHandle(mfn.object()))
+        component = pyobject(MDagPath=self.geometry, MObjectHandle=om.MObjectHandle(mfn.object()))
         return component
 
     def _get_comp_class(self):
@@ -279,6 +287,8 @@ class ComponentAccessor:
 class BaseSelector(ABC):
     def __init__(self, object_type:ObjectType):
         self.object_type = object_type
+        # The subtype enum never changes for a given selector, so it is looked up once here rather than on each call
+        self._subtype = ObjectType.get_subtype(object_type)
         self._registry = {}
 
     def __call__(self, *args, **kwargs):
@@ -290,12 +300,8 @@ class BaseSelector(ABC):
     def get_class(self, MObjectHandle:om.MObjectHandle, **kwargs) -> Callable:
         obj = MObjectHandle.object()
 
-        sub_type_enum = ObjectType.get_subtype(self.object_type)
-        for sub_mfn in sub_type_enum.iter_mfn():
-            if obj.hasFn(sub_mfn):
-                exact_type = sub_type_enum.from_mfn(sub_mfn)
-                break
-        else:
+        exact_type = self._subtype.from_mobject(obj)
+        if exact_type is None:
             exact_type = self.object_type
 
         cls = self._registry.get(exact_type)
@@ -311,6 +317,10 @@ class AttributeSelector(BaseSelector):
         else:
             return super().get_class(**kwargs)
 
+# The numeric data types that are created with a dedicated function instead of MFnNumericAttribute.create
+_numeric_create_functions = {DataType.COLOR: om.MFnNumericAttribute.createColor,
+                             DataType.FLOAT3: om.MFnNumericAttribute.createPoint}
+
 class AttrFactory:
     def __new__(cls, data:AttrData) -> om.MFnAttribute:
         """
@@ -334,18 +344,18 @@ class AttrFactory:
         mfn = AttrType.to_function_set(data.attr_type)()
 
         # Call the create appropriate function. Special cases like COLOR and FLOAT3 have a different create function
-        if data.attr_type == AttrType.NUMERIC and data.data_type in (DataType.COLOR, DataType.FLOAT3):
-            if data.data_type == DataType.COLOR:
-                mfn.createColor(*data.create_args)
-            elif data.data_type == DataType.FLOAT3:
-                mfn.createPoint(*data.create_args)
-        else:
+        create = None
+        if data.attr_type is AttrType.NUMERIC:
+            create = _numeric_create_functions.get(data.data_type)
+        if create is None:
             mfn.create(*data.create_args)
+        else:
+            create(mfn, *data.create_args)
 
         # POST PROCESS
         # For the ENUM type we must add the fields one by one
         # Then we set the default value, which can be an int or a string
-        if data.attr_type == AttrType.ENUM:
+        if data.attr_type is AttrType.ENUM:
             for name, value in data.enum_fields:
                 mfn.addField(name, value)
             dv = data.default_value
@@ -357,17 +367,14 @@ class AttrFactory:
 
         # For the UNIT and NUMERIC type, set the bounds and soft bounds if any were provided
         if data.attr_type in (AttrType.UNIT, AttrType.NUMERIC):
-            if data.min is not None:
-                mfn.setMin(data.min)
-            if data.max is not None:
-                mfn.setMax(data.max)
-            if data.soft_min is not None:
-                mfn.setSoftMin(data.soft_min)
-            if data.soft_max is not None:
-                mfn.setSoftMax(data.soft_max)
+            # The setters are only looked up for the bounds that were provided
+            for setter_name, value in (('setMin', data.min), ('setMax', data.max),
+                                       ('setSoftMin', data.soft_min), ('setSoftMax', data.soft_max)):
+                if value is not None:
+                    getattr(mfn, setter_name)(value)
 
         # For the STRING type, apply the optional as_filename parameter
-        if data.attr_type == AttrType.STRING:
+        if data.attr_type is AttrType.STRING:
             mfn.usedAsFilename = data.as_filename
 
         mfn.array = data.multi
@@ -441,7 +448,7 @@ class UserClassManager:
         if parent_class in self._by_parent_class:
             data = self._by_parent_class[parent_class]
             if isinstance(obj, str):
-                obj = name_to_api(obj, as_mobject=True)
+                obj = name_to_mobject(obj)
 
             for d in data:
                 if d.validator(obj):
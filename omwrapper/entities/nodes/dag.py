@@ -3,34 +3,47 @@ from typing import Dict, Union
 
 from maya.api import OpenMaya as om
 
-from omwrapper.api import apiundo
+from omwrapper.api import undoqueue
 from omwrapper.api.modifiers.custom import ProxyModifier
 from omwrapper.api.modifiers.maya import DagModifier
-from omwrapper.api.utilities import name_to_api
-from omwrapper.entities.base import TMayaObjectApi, recycle_mfn
+from omwrapper.api.utilities import name_to_dag
+from omwrapper.entities.base import TMayaObjectApi
 from omwrapper.entities.nodes.dependency import DependNode
 
 #ToDo: addChild and setParent
 class DagNode(DependNode):
+    __slots__ = ('_mfn', '_mfn_dagpath')
     _mfn_class = om.MFnDagNode
     _mfn_constant = om.MFn.kDagNode
 
+    def __init__(self, **kwargs: TMayaObjectApi):
+        super().__init__(**kwargs)
+        # Function set returned by api_mfn, built on first use along with the path it is attached to, so that it is
+        #  rebuilt if the path of this node gets replaced. It is never reused once the node is deleted
+        self._mfn = None
+        self._mfn_dagpath = None
+
     def api_dagpath(self):
         return self._api_input['MDagPath']
 
     def api_mfn(self) -> om.MFnDagNode:
-        return self._mfn_class(self.api_dagpath())
+        dagpath = self.api_dagpath()
+        if self._mfn is None or self._mfn_dagpath is not dagpath or not self.api_mobject_handle().isValid():
+            self._mfn = self._mfn_class(dagpath)
+            self._mfn_dagpath = dagpath
+        return self._mfn
 
     @classmethod
     def get_build_data_from_name(cls, name:str) -> Dict[str, TMayaObjectApi]:
-        dag = name_to_api(name)
-        if not isinstance(dag, om.MDagPath):
-            raise TypeError(f'{name} is not a DAG Node')
+        dag = name_to_dag(name)
 
         return {'MDagPath': dag, 'MObjectHandle': om.MObjectHandle(dag.node())}
 
     def name(self, full_dag_path:bool=False) -> str:
-        mfn = om.MFnDagNode(self.api_mobject())
+        mfn = self._name_mfn
+        if mfn is None or not self.api_mobject_handle().isValid():
+            # Building a new function set for a deleted node raises, as the handle then gives a null object
+            mfn = self._name_mfn = om.MFnDagNode(self.api_mobject())
         if full_dag_path:
             return mfn.fullPathName()
         return mfn.name()
@@ -40,19 +53,29 @@ class DagNode(DependNode):
             return self
 
         mobj = self.api_mobject()
+        # A single function set is rebound to each parent in turn
+        mfn = om.MFnDagNode()
         for x in range(index):
-            mobj = om.MFnDagNode(mobj).parent(0)
+            mfn.setObject(mobj)
+            mobj = mfn.parent(0)
             if mobj.apiType() == om.MFn.kWorld:
                 return None
         return self._factory(MObject=mobj)
 
-    @recycle_mfn
     def get_children(self, mfn:om.MFnDagNode=None) -> "DagNode":
+        if mfn is None:
+            mfn = self.api_mfn()
+        # The path of each child is extended from the path of this node, which is cheaper than having the factory
+        #  look for a path to the child, and keeps the children under the same instance as their parent
+        factory = self._factory
+        dagpath = self.api_dagpath()
         for x in range(mfn.childCount()):
-            yield self._factory(MObject=mfn.child(x))
+            child = mfn.child(x)
+            yield factory(MDagPath=om.MDagPath(dagpath).push(child), MObjectHandle=om.MObjectHandle(child))
 
-    @recycle_mfn
     def get_child(self, index:int, mfn:om.MFnDagNode=None):
+        if mfn is None:
+            mfn = self.api_mfn()
         return self._factory(MObject=mfn.child(index))
 
     def _get_selectable_object(self) -> om.MDagPath:
@@ -103,10 +126,9 @@ class DagNode(DependNode):
         mod = DagModifier()
         obj = mod.create_node(node_type=node_type, name=name, parent=parent)
         mod.doIt()
-        apiundo.commit(undo=mod.undoIt, redo=mod.doIt)
+        undoqueue.commit(undo=mod.undoIt, redo=mod.doIt)
         return cls._factory(MObject=obj)
 
-    @recycle_mfn
     def add_child_(self, node:Union["DagNode", om.MObject, om.MObjectHandle], index:int=None, keep_parent:bool=False, mfn:om.MFnDagNode=None):
         """
         [NOT UNDOABLE]
@@ -122,6 +144,8 @@ class DagNode(DependNode):
         Returns:
             None
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         if not isinstance(node, om.MObject):
             node = node.api_mobject()
         elif isinstance(node, om.MObjectHandle):
@@ -131,7 +155,6 @@ class DagNode(DependNode):
             index = mfn.kNextPos
         mfn.addChild(node, index, keep_parent)
 
-    @recycle_mfn
     def remove_child_(self, node:Union["DagNode", om.MObject, om.MObjectHandle], mfn:om.MFnDagNode=None):
         """
         [NOT UNDOABLE]
@@ -145,6 +168,8 @@ class DagNode(DependNode):
         Returns:
             None
         """
+        if mfn is None:
+            mfn = self.api_mfn()
 
         if not isinstance(node, om.MObject):
             node = node.api_mobject()
@@ -153,7 +178,6 @@ class DagNode(DependNode):
 
         mfn.removeChild(node)
 
-    @recycle_mfn
     def remove_child_at_(self, index:int, mfn: om.MFnDagNode = None):
         """
         [NOT UNDOABLE]
@@ -167,9 +191,10 @@ class DagNode(DependNode):
         Returns:
             None
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         mfn.removeChildAt(index)
 
-    @recycle_mfn
     def add_child(self, node: Union["DagNode", om.MObject, om.MObjectHandle], index: int = None, keep_parent: bool = False,
                    mfn: om.MFnDagNode = None):
         """
@@ -186,6 +211,8 @@ class DagNode(DependNode):
         Returns:
             None
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         if not isinstance(node, om.MObject):
             node = node.api_mobject()
         elif isinstance(node, om.MObjectHandle):
@@ -216,10 +243,9 @@ class DagNode(DependNode):
         do_kwargs = {'node':node, 'index':index, 'keep_parent':keep_parent, 'mfn':mfn}
         mod = ProxyModifier(do_func=self.add_child_, do_kwargs=do_kwargs, undo_func=undo_func)
         mod.doIt()
-        apiundo.commit(undo=mod.undoIt, redo=mod.doIt)
+        undoqueue.commit(undo=mod.undoIt, redo=mod.doIt)
 
 
-    @recycle_mfn
     def remove_child(self, node: Union["DagNode", om.MObject, om.MObjectHandle], mfn: om.MFnDagNode = None):
         """
         [UNDOABLE]
@@ -233,6 +259,8 @@ class DagNode(DependNode):
         Returns:
             None
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         if not isinstance(node, om.MObject):
             node = node.api_mobject()
         elif isinstance(node, om.MObjectHandle):
@@ -249,9 +277,8 @@ class DagNode(DependNode):
         mod = ProxyModifier(do_func=self.remove_child_, do_kwargs=do_kwargs,
                             undo_func=self.add_child_, undo_kwargs=undo_kwargs)
         mod.doIt()
-        apiundo.commit(undo=mod.undoIt, redo=mod.doIt)
+        undoqueue.commit(undo=mod.undoIt, redo=mod.doIt)
 
-    @recycle_mfn
     def remove_child_at(self, index: int, mfn: om.MFnDagNode = None):
         """
         [UNDOABLE]
@@ -265,6 +292,8 @@ class DagNode(DependNode):
         Returns:
             None
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         node = mfn.child(index)
 
         do_kwargs = {'index': index, 'mfn': mfn}
@@ -272,4 +301,4 @@ class DagNode(DependNode):
         mod = ProxyModifier(do_func=self.remove_child_at_, do_kwargs=do_kwargs,
                             undo_func=self.add_child_, undo_kwargs=undo_kwargs)
         mod.doIt()
-        apiundo.commit(undo=mod.undoIt, redo=mod.doIt)
\ No newline at end of file
+        undoqueue.commit(undo=mod.undoIt, redo=mod.doIt)
\ No newline at end of file
@@ -10,20 +10,24 @@ from omwrapper.api.modifiers.maya import DGModifier
 from omwrapper.api.utilities import name_to_api
 from omwrapper.entities.attributes.base import AttributeHandler, AttrData
 from omwrapper.entities.factory import AttrFactory
-from omwrapper.entities.base import MayaObject, TMayaObjectApi, recycle_mfn
-from omwrapper.api import apiundo
+from omwrapper.entities.base import MayaObject, TMayaObjectApi
+from omwrapper.api import undoqueue
 
 if TYPE_CHECKING:
     from omwrapper.entities.attributes.base import Attribute
 
 
 class DependNode(MayaObject):
+    __slots__ = ('_attribute_handler', '_name_mfn')
     _mfn_class = om.MFnDependencyNode
     _mfn_constant = om.MFn.kDependencyNode
 
     def __init__(self, **kwargs: TMayaObjectApi):
         super().__init__(**kwargs)
         self._attribute_handler = AttributeHandler(self.api_mobject())
+        # Function set used by name(), built on first use. It is attached to the MObject, so it always returns the
+        #  current name of the node, but it must not be used anymore once the node is deleted
+        self._name_mfn = None
 
     def __getattr__(self, item) -> Attribute:
         attr = self.attr(item)
@@ -34,7 +38,10 @@ class DependNode(MayaObject):
         return self._mfn_class(self.api_mobject())
 
     def name(self, full_dag_path:bool=False) -> str:
-        mfn = om.MFnDependencyNode(self.api_mobject())
+        mfn = self._name_mfn
+        if mfn is None or not self.api_mobject_handle().isValid():
+            # Building a new function set for a deleted node raises, as the handle then gives a null object
+            mfn = self._name_mfn = om.MFnDependencyNode(self.api_mobject())
         return mfn.name()
 
     @classmethod
@@ -45,7 +52,6 @@ class DependNode(MayaObject):
 
         return {'MObjectHandle': om.MObjectHandle(mobj)}
 
-    @recycle_mfn
     def rename_(self, name:str, mfn:om.MFnDependencyNode=None) -> str:
         """
         Rename the node - NOT UNDOABLE -
@@ -58,6 +64,8 @@ class DependNode(MayaObject):
             str: the new name of the node
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         name = mfn.setName(name)
         return name
 
@@ -142,7 +150,7 @@ class DependNode(MayaObject):
                 py_node.add_attr(at, _modifier=mod)
             mod.doIt()  # Executing the modifier
             node.attribute_handler().purge()    # Purging the buffer of the attribute_handler
-            apiundo.commit(undo=mod.undoIt, redo=mod.doIt)  # Adding this operation to the undo queue (optional)
+            undoqueue.commit(undo=mod.undoIt, redo=mod.doIt)  # Adding this operation to the undo queue (optional)
         """
         if len(args) and isinstance(args[0], AttrData):
             data = args[0]
@@ -180,7 +188,6 @@ class DependNode(MayaObject):
         else:
             raise AttributeError(f'{self.name()} has no attribute named {name}')
 
-    @recycle_mfn
     def is_locked(self, mfn:om.MFnDependencyNode=None) -> bool:
         """
         Whether this node is locked or not
@@ -190,21 +197,26 @@ class DependNode(MayaObject):
             mfn (MFnDependencyNode, optional): an optional compatible MFn.
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         locked = mfn.isLocked
         return locked
 
-    @recycle_mfn
     def set_locked_(self, value:bool, mfn:om.MFnDependencyNode=None):
+        if mfn is None:
+            mfn = self.api_mfn()
         mfn.isLocked = value
 
-    @recycle_mfn
     def set_locked(self, value:bool, mfn:om.MFnDependencyNode=None):
+        if mfn is None:
+            mfn = self.api_mfn()
         old_value = mfn.isLocked
-        modifier = ProxyModifier(do_func=self.set_locked_, do_kwargs={'value':value, 'mfn':mfn},
-                                 undo_kwargs={'value':old_value, 'mfn':mfn})
+        set_locked_ = self.set_locked_
+        modifier = ProxyModifier(do_func=lambda: set_locked_(value, mfn=mfn),
+                                 undo_func=lambda: set_locked_(old_value, mfn=mfn))
         modifier.doIt()
 
-        apiundo.commit(undo=modifier.undoIt, redo=modifier.doIt)
+        undoqueue.commit(undo=modifier.undoIt, redo=modifier.doIt)
 
         return modifier
 
@@ -239,5 +251,5 @@ class DependNode(MayaObject):
         mod = DGModifier()
         obj = mod.create_node(node_type=node_type, name=name)
         mod.doIt()
-        apiundo.commit(undo=mod.undoIt, redo=mod.doIt)
+        undoqueue.commit(undo=mod.undoIt, redo=mod.doIt)
         return cls._factory(MObject=obj)
@@ -8,7 +8,7 @@ from omwrapper.api.utilities import name_to_api, TApi
 from omwrapper.entities.nodes.dependency import DependNode
 from omwrapper.pytools import Iterator
 
-from omwrapper.entities.base import MayaObject, recycle_mfn
+from omwrapper.entities.base import MayaObject
 
 TSetMemberInput = Union[str, MayaObject, Tuple[om.MDagPath, om.MObject], om.MDagPath, om.MObject, om.MPlug]
 TSetMember = Union[om.MObject, Tuple[om.MDagPath, om.MObject], om.MPlug]
@@ -17,7 +17,6 @@ class ObjectSet(DependNode):
     _mfn_class = om.MFnSet
     _mfn_constant = om.MFn.kSet
 
-    @recycle_mfn
     def add_member(self, member:TSetMemberInput, mfn:om.MFnSet=None):
         """
         Add a single object to this set
@@ -30,11 +29,12 @@ class ObjectSet(DependNode):
             None
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         member = self._process_member(member)
         mfn.addMember(member)
 
 
-    @recycle_mfn
     def add_members(self, members:Union[List[TSetMemberInput], om.MSelectionList],
                     mfn:om.MFnSet=None) -> om.MSelectionList:
         """
@@ -47,20 +47,22 @@ class ObjectSet(DependNode):
             MSelectionList: the list of objects added to this set
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         if not isinstance(members, om.MSelectionList):
             members = self._process_members(members=members)
         mfn.addMembers(members)
         return members
 
-    @recycle_mfn
     def get_members(self, flatten:bool=False, as_api:bool=False,  mfn:om.MFnSet=None):
+        if mfn is None:
+            mfn = self.api_mfn()
         members = mfn.getMembers(flatten=flatten)
         if as_api:
             return members
         else:
             return self._factory.from_selection_list(members)
 
-    @recycle_mfn
     def remove_member(self, member: TSetMemberInput, mfn: om.MFnSet = None):
         """
         Remove a single object from this set
@@ -73,10 +75,11 @@ class ObjectSet(DependNode):
             None
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         member = self._process_member(member)
         mfn.removeMember(member)
 
-    @recycle_mfn
     def remove_members(self, members: Union[List[TSetMemberInput], om.MSelectionList],
                     mfn: om.MFnSet = None) -> om.MSelectionList:
         """
@@ -89,17 +92,21 @@ class ObjectSet(DependNode):
             MSelectionList: the list of objects removed to this set
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         if not isinstance(members, om.MSelectionList):
             members = self._process_members(members=members)
         mfn.removeMembers(members)
         return members
 
-    @recycle_mfn
     def is_member(self, member:TSetMemberInput, mfn:om.MFnSet=None):
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.isMember(self._process_member(member))
 
-    @recycle_mfn
     def clear(self, mfn:om.MFnSet=None):
+        if mfn is None:
+            mfn = self.api_mfn()
         mfn.clear()
 
     def _process_member(self, member:TSetMemberInput) -> TSetMember:
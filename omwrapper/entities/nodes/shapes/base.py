@@ -6,7 +6,11 @@ from omwrapper.entities.nodes.dag import DagNode
 
 
 class GeometryShape(DagNode):
-    ...
+
+    def api_mfn(self) -> om.MFnDagNode:
+        # Geometry function sets keep their own copy of some of the geometry data, which gets stale as soon as the
+        #  shape is edited by something else, so a new one is built every time
+        return self._mfn_class(self.api_dagpath())
 
 
 TPointsSequence = Union[Iterable[Union[om.MPoint, om.MFloatPoint]], om.MPointArray]
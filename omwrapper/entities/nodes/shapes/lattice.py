@@ -4,7 +4,7 @@ from typing import Sequence
 from maya.api import OpenMaya as om
 
 from omwrapper.constants import ComponentType
-from omwrapper.entities.base import recycle_mfn, undoable_proxy_wrap
+from omwrapper.entities.base import undoable_proxy_wrap
 from omwrapper.entities.factory import ComponentAccessor
 from omwrapper.entities.nodes.shapes.base import GeometryShape, TPointsSequence
 from omwrapper.pytools import sequence_product
@@ -107,7 +107,6 @@ class LatticeShape(GeometryShape):
         mit = self._get_mit()
         return mit.allPositions(space=space)
 
-    @recycle_mfn
     def set_points_(self, points: TPointsSequence, space: int = om.MSpace.kObject):
         """
         [NOT UNDOABLE]
@@ -124,7 +123,6 @@ class LatticeShape(GeometryShape):
         mit = self._get_mit()
         mit.setAllPositions(points, space=space)
 
-    @recycle_mfn
     @undoable_proxy_wrap(get_points, set_points_)
     def set_points(self, points: TPointsSequence, space: int = om.MSpace.kObject):
         """
@@ -1,7 +1,7 @@
 from maya.api import OpenMaya as om
 
 from omwrapper.constants import ComponentType, DataType
-from omwrapper.entities.base import recycle_mfn, undoable_proxy_wrap
+from omwrapper.entities.base import undoable_proxy_wrap
 from omwrapper.entities.factory import ComponentAccessor
 from omwrapper.entities.nodes.shapes.base import GeometryShape, TPointsSequence
 
@@ -21,7 +21,6 @@ class Mesh(GeometryShape):
     def create(cls, *args, **kwargs) -> None:
         raise NotImplementedError('Mesh.create is not implemented yet')
 
-    @recycle_mfn
     def get_point(self, index:int, space:int=om.MSpace.kObject, mfn:om.MFnMesh=None) -> om.MPoint:
         """
         Query the position of a vertex
@@ -34,9 +33,10 @@ class Mesh(GeometryShape):
             MPoint: the position of the vertex in the required space
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.getPoint(index, space=space)
 
-    @recycle_mfn
     def set_point_(self, point:om.MPoint, index: int, space: int = om.MSpace.kObject, mfn: om.MFnMesh = None):
         """
         [NOT UNDOABLE]
@@ -52,9 +52,10 @@ class Mesh(GeometryShape):
             None
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         mfn.setPoint(index, space=space)
 
-    @recycle_mfn
     @undoable_proxy_wrap(get_point, set_point_)
     def set_point(self, point:om.MPoint, index: int, space: int = om.MSpace.kObject, mfn: om.MFnMesh = None):
         """
@@ -73,7 +74,6 @@ class Mesh(GeometryShape):
         """
         ...
 
-    @recycle_mfn
     def get_points(self, space:int=om.MSpace.kObject, mfn:om.MFnMesh=None) -> om.MPointArray:
         """
         Query the position of all the vertices
@@ -85,9 +85,10 @@ class Mesh(GeometryShape):
             MPointArray: an array containing the position of the vertices in the required space
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.getPoints(space=space)
 
-    @recycle_mfn
     def set_points_(self, points: TPointsSequence, space: int = om.MSpace.kObject, mfn: om.MFnMesh = None):
         """
         [NOT UNDOABLE]
@@ -102,9 +103,10 @@ class Mesh(GeometryShape):
             None
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         mfn.setPoints(points, space=space)
 
-    @recycle_mfn
     @undoable_proxy_wrap(get_points, set_points_)
     def set_points(self, points: TPointsSequence, space: int = om.MSpace.kObject, mfn: om.MFnMesh = None):
         """
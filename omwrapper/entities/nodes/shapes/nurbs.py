@@ -5,10 +5,10 @@ from typing import Union, Iterable, TYPE_CHECKING, Sequence
 
 from maya.api import OpenMaya as om
 
-from omwrapper.api import apiundo
+from omwrapper.api import undoqueue
 from omwrapper.api.modifiers.maya import DagModifier
 from omwrapper.constants import DataType, ComponentType
-from omwrapper.entities.base import recycle_mfn, undoable_proxy_wrap
+from omwrapper.entities.base import undoable_proxy_wrap
 from omwrapper.entities.factory import ComponentAccessor
 from omwrapper.entities.nodes.shapes.base import GeometryShape, TPointsSequence
 
@@ -75,14 +75,14 @@ class NurbsCurve(GeometryShape):
         edit_mod.set_plug_value(plug, data)
         edit_mod.doIt()
 
-        apiundo.commit(undo=modifier.undoIt, redo=modifier.doIt)
+        undoqueue.commit(undo=modifier.undoIt, redo=modifier.doIt)
         return curve
 
-    @recycle_mfn
     def update(self, mfn:om.MFnNurbsCurve=None):
+        if mfn is None:
+            mfn = self.api_mfn()
         mfn.updateCurve()
 
-    @recycle_mfn
     def get_point(self, index: int, space: int = om.MSpace.kObject, mfn: om.MFnNurbsCurve = None) -> om.MPoint:
         """
         Query the position of a ControlVertex
@@ -95,9 +95,10 @@ class NurbsCurve(GeometryShape):
             MPoint: the position of the vertex in the required space
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.cvPosition(index, space=space)
 
-    @recycle_mfn
     def set_point_(self, point: om.MPoint, index: int, space: int = om.MSpace.kObject, mfn: om.MFnNurbsCurve = None):
         """
         [NOT UNDOABLE]
@@ -113,10 +114,11 @@ class NurbsCurve(GeometryShape):
             None
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         mfn.setCVPosition(index, point, space=space)
         mfn.updateCurve()
 
-    @recycle_mfn
     @undoable_proxy_wrap(get_point, set_point_)
     def set_point(self, point: om.MPoint, index: int, space: int = om.MSpace.kObject, mfn: om.MFnNurbsCurve = None):
         """
@@ -135,7 +137,6 @@ class NurbsCurve(GeometryShape):
         """
         ...
 
-    @recycle_mfn
     def get_points(self, space: int = om.MSpace.kObject, mfn: om.MFnNurbsCurve = None) -> om.MPointArray:
         """
         Query the position of all ControlVertices
@@ -147,9 +148,10 @@ class NurbsCurve(GeometryShape):
             MPoint: the position of the vertex in the required space
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.cvPositions(space=space)
 
-    @recycle_mfn
     def set_points_(self, points: TPointsSequence, space: int = om.MSpace.kObject, mfn: om.MFnNurbsCurve = None):
         """
         [NOT UNDOABLE]
@@ -164,11 +166,12 @@ class NurbsCurve(GeometryShape):
             None
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         mfn.setCVPositions(points, space=space)
         mfn.updateCurve()
 
 
-    @recycle_mfn
     @undoable_proxy_wrap(get_points, set_points_)
     def set_points(self, points: TPointsSequence, space: int = om.MSpace.kObject, mfn: om.MFnNurbsCurve = None):
         """
@@ -186,7 +189,6 @@ class NurbsCurve(GeometryShape):
         """
         ...
 
-    @recycle_mfn
     def get_param_at_point(self, point:Union[om.MPoint(), Iterable[float]], tolerance:float=0.001,
                            space:int=om.MSpace.kObject, mfn:om.MFnNurbsCurve=None) -> float:
         """
@@ -203,10 +205,11 @@ class NurbsCurve(GeometryShape):
             float: the curve parameter at the given point
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         point = DataType.to_point(point)
         return mfn.getParamAtPoint(point, tolerance=tolerance, space=space)
 
-    @recycle_mfn
     def get_point_at_param(self, param: float, space: int = om.MSpace.kObject, mfn:om.MFnNurbsCurve=None) -> om.MPoint:
         """
         Get the point at the given curve parameter.
@@ -220,9 +223,10 @@ class NurbsCurve(GeometryShape):
             MPoint: the point at the given parameter in the required space
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.getParamAtPoint(param, space=space)
 
-    @recycle_mfn
     def find_param_from_length(self, length:float, mfn:om.MFnNurbsCurve=None) -> float:
         """
         Get the parameter value at the given length. If the parameter cannot be determined, then the value at the end
@@ -236,9 +240,10 @@ class NurbsCurve(GeometryShape):
             float: the parameter at the given length
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.findParamFromLength(length)
 
-    @recycle_mfn
     def find_length_from_param(self, param: float, mfn: om.MFnNurbsCurve = None) -> float:
         """
         Get the length at the given parameter. If the length cannot be determined, then a distance of 0.0 is returned.
@@ -251,6 +256,8 @@ class NurbsCurve(GeometryShape):
             float: the parameter at the given length
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.findParamFromLength(param)
 
     @property
@@ -292,16 +299,18 @@ class NurbsCurve(GeometryShape):
     def knot_domain(self):
         return self.api_mfn().knotDomain
 
-    @recycle_mfn
     def get_curve_data(self, space:int=om.MSpace.kObject, mfn: om.MFnNurbsCurve = None) -> dict:
+        if mfn is None:
+            mfn = self.api_mfn()
         data = {'degree':mfn.degree,
                 'form':mfn.form,
                 'cvs':mfn.cvPositions(space=space),
                 'knots':mfn.knots()}
         return data
 
-    @recycle_mfn
     def get_json_curve_data(self, space:int=om.MSpace.kObject, mfn: om.MFnNurbsCurve = None) -> str:
+        if mfn is None:
+            mfn = self.api_mfn()
         data = self.get_curve_data(space=space, mfn=mfn)
         data['cvs'] = [(p.x, p.y, p.z) for p in data['cvs']]
         data['knots'] = list(data['knots'])
@@ -327,11 +336,11 @@ class NurbsSurface(GeometryShape):
     def create(cls, *args, **kwargs) -> None:
         raise NotImplementedError('Mesh.create is not implemented yet')
 
-    @recycle_mfn
     def update(self, mfn: om.MFnNurbsSurface = None):
+        if mfn is None:
+            mfn = self.api_mfn()
         mfn.updateSurface()
 
-    @recycle_mfn
     def get_point(self, index: Sequence[int], space: int = om.MSpace.kObject, mfn: om.MFnNurbsSurface = None) -> om.MPoint:
         """
         Query the position of a ControlVertex
@@ -344,10 +353,11 @@ class NurbsSurface(GeometryShape):
             MPoint: the position of the vertex in the required space
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         u, v = index
         return mfn.cvPosition(u, v, space=space)
 
-    @recycle_mfn
     def set_point_(self, point: om.MPoint, index: Sequence[int], space: int = om.MSpace.kObject, mfn: om.MFnNurbsSurface = None):
         """
         [NOT UNDOABLE]
@@ -363,10 +373,11 @@ class NurbsSurface(GeometryShape):
             None
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         mfn.setCVPosition(*index, point, space=space)
         mfn.updateSurface()
 
-    @recycle_mfn
     @undoable_proxy_wrap(get_point, set_point_)
     def set_point(self, point: om.MPoint, index: Sequence[int], space: int = om.MSpace.kObject, mfn: om.MFnNurbsSurface = None):
         """
@@ -385,7 +396,6 @@ class NurbsSurface(GeometryShape):
         """
         ...
 
-    @recycle_mfn
     def get_points(self, space: int = om.MSpace.kObject, mfn: om.MFnNurbsSurface = None) -> om.MPointArray:
         """
         Query the position of all ControlVertices
@@ -397,9 +407,10 @@ class NurbsSurface(GeometryShape):
             MPoint: the position of the vertex in the required space
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.cvPositions(space=space)
 
-    @recycle_mfn
     def set_points_(self, points: TPointsSequence, space: int = om.MSpace.kObject, mfn: om.MFnNurbsSurface = None):
         """
         [NOT UNDOABLE]
@@ -414,10 +425,11 @@ class NurbsSurface(GeometryShape):
             None
 
         """
+        if mfn is None:
+            mfn = self.api_mfn()
         mfn.setCVPositions(points, space=space)
         mfn.updateSurface()
 
-    @recycle_mfn
     @undoable_proxy_wrap(get_points, set_points_)
     def set_points(self, points: TPointsSequence, space: int = om.MSpace.kObject, mfn: om.MFnNurbsSurface = None):
         """
@@ -2,11 +2,10 @@ from typing import List, Union
 
 from maya.api import OpenMaya as om
 
-from omwrapper.api import apiundo
+from omwrapper.api import undoqueue
 from omwrapper.api.modifiers.base import add_modifier
 from omwrapper.api.modifiers.custom import ProxyModifier
 from omwrapper.api.modifiers.maya import DagModifier
-from omwrapper.entities.base import recycle_mfn
 from omwrapper.entities.nodes.dag import DagNode
 
 
@@ -73,9 +72,10 @@ class Transform(DagNode):
                 ...
         raise AttributeError(f'No attribute named {name}')
 
-    @recycle_mfn
     def set_matrix_(self, matrix:Union[om.MMatrix, om.MTransformationMatrix], space:int=om.MSpace.kObject,
                     mfn:om.MFnTransform=None):
+        if mfn is None:
+            mfn = self.api_mfn()
         if not isinstance(matrix, om.MTransformationMatrix):
             matrix = om.MTransformationMatrix(matrix)
 
@@ -99,8 +99,9 @@ class Transform(DagNode):
         undo_kwargs = {'matrix':self.get_matrix(space=space), 'space':space}
         mod = ProxyModifier(do_func=self.set_matrix_, do_kwargs=do_kwargs, undo_kwargs=undo_kwargs)
         mod.doIt()
-        apiundo.commit(undo=mod.undoIt, redo=mod.doIt)
+        undoqueue.commit(undo=mod.undoIt, redo=mod.doIt)
 
-    @recycle_mfn
     def get_rotation(self, space:int=om.MSpace.kTransform, as_quaternion:bool=False, mfn:om.MFnTransform=None):
+        if mfn is None:
+            mfn = self.api_mfn()
         return mfn.rotation(space, asQuaternion=as_quaternion)
\ No newline at end of file
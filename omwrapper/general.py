@@ -5,13 +5,12 @@ from maya.api import OpenMaya as om
 
 from omwrapper.api.modifiers.custom import ProxyModifier
 from omwrapper.api.modifiers.maya import DagModifier, DGModifier
-from omwrapper.api.utilities import name_to_api
+from omwrapper.api.utilities import name_to_mobject
 from omwrapper.entities.base import MayaObject, undoable_proxy_wrap
-from omwrapper.entities.factory import PyObject
 from omwrapper.entities.registration import pyobject
-from omwrapper.api import apiundo
+from omwrapper.api import undoqueue
 
-factory = PyObject()
+factory = pyobject
 
 def create_node(node_type:str, name:str=None, parent:Union[MayaObject, str, om.MObject]=None,
                 _modifier:Union[DagModifier, DGModifier]=None, _is_dag:bool=None) -> MayaObject:
@@ -60,13 +59,13 @@ def create_node(node_type:str, name:str=None, parent:Union[MayaObject, str, om.M
         if isinstance(parent, MayaObject):
             parent = parent.api_mobject()
         elif isinstance(parent, str):
-            parent = name_to_api(parent, as_mobject=True)
+            parent = name_to_mobject(parent)
         kwargs['parent'] = parent
 
     obj = mod.create_node(node_type=node_type, **kwargs)
     if do_it:
         mod.doIt()
-        apiundo.commit(undo=mod.undoIt, redo=mod.doIt)
+        undoqueue.commit(undo=mod.undoIt, redo=mod.doIt)
     return factory(MObject=obj)
 
 def selected() -> List[MayaObject]:
@@ -120,5 +119,5 @@ def select(*args:Union[MayaObject, str], add:bool=False, deselect:bool=False,
     mod = ProxyModifier(do_func=select_, undo_func=select_,
                         do_args=args, do_kwargs=kwargs,
                         undo_args=[sel], undo_kwargs=kwargs)
-    apiundo.commit(undo=mod.undoIt, redo=mod.doIt)
+    undoqueue.commit(undo=mod.undoIt, redo=mod.doIt)
     mod.doIt()
\ No newline at end of file